@@ -7,9 +7,12 @@ from pytgcalls.exceptions import NoActiveGroupCall
 import config
 from DESTINYMUSIC import LOGGER, app, userbot
 from DESTINYMUSIC.core.call import JARVIS
+from DESTINYMUSIC.core.peers import persist_peers
 from DESTINYMUSIC.misc import sudo
 from DESTINYMUSIC.plugins import ALL_MODULES
 from DESTINYMUSIC.utils.database import get_banned_users, get_gbanned
+from DESTINYMUSIC.utils.metrics import start_exporter
+from DESTINYMUSIC.utils.stream.snapshot import restore_snapshots, save_snapshots
 from DESTINYMUSIC.utils.cookie_handler import fetch_and_store_cookies 
 from config import BANNED_USERS
 
@@ -65,10 +68,21 @@ async def init():
         pass
 
     await JARVIS.decorators()
+    if config.METRICS_PORT:
+        try:
+            await start_exporter(config.METRICS_PORT)
+        except Exception as e:
+            LOGGER("DESTINYMUSIC").warning(f"ᴍᴇᴛʀɪᴄs ᴇxᴘᴏʀᴛᴇʀ ғᴀɪʟᴇᴅ: {e}")
+    asyncio.create_task(restore_snapshots())
     LOGGER("DESTINYMUSIC").info(
         "\x41\x6e\x6e\x69\x65\x20\x4d\x75\x73\x69\x63\x20\x52\x6f\x62\x6f\x74\x20\x53\x74\x61\x72\x74\x65\x64\x20\x53\x75\x63\x63\x65\x73\x73\x66\x75\x6c\x6c\x79\x2e\x2e\x2e"
     )
     await idle()
+    try:
+        await save_snapshots()
+        await persist_peers()
+    except Exception as e:
+        LOGGER("DESTINYMUSIC").warning(f"ǫᴜᴇᴜᴇ sɴᴀᴘsʜᴏᴛ ғᴀɪʟᴇᴅ: {e}")
     await app.stop()
     await userbot.stop()
     LOGGER("DESTINYMUSIC").info("sᴛᴏᴘᴘɪɴɢ ᴀɴɴɪᴇ ᴍᴜsɪᴄ ʙᴏᴛ ...")
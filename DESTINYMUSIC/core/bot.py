@@ -5,6 +5,7 @@ import config
 import sys
 
 from ..logging import LOGGER
+from .peers import load_peers
 
 
 class JARVIS(Client):
@@ -22,6 +23,7 @@ class JARVIS(Client):
         
     async def start(self):
         await super().start()
+        peers = load_peers(self)
         get_me = await self.get_me()
         self.username = get_me.username
         self.id = get_me.id
@@ -49,4 +51,4 @@ class JARVIS(Client):
                 "Please promote your bot as an admin in your log group/channel."
             )
             sys.exit()
-        LOGGER(__name__).info(f"Music Bot Started as {self.name}")
+        LOGGER(__name__).info(f"Music Bot Started as {self.name} with {peers} cached peers")
@@ -1,6 +1,8 @@
 import asyncio
 import os
-from datetime import datetime, timedelta
+import re
+import time
+from datetime import datetime
 from typing import Union
 
 from ntgcalls import TelegramServerError
@@ -9,49 +11,123 @@ from pyrogram.errors import FloodWait, ChatAdminRequired
 from pyrogram.types import InlineKeyboardMarkup
 from pytgcalls import PyTgCalls
 from pytgcalls.exceptions import NoActiveGroupCall
-from pytgcalls.types import AudioQuality, ChatUpdate, MediaStream, StreamEnded, Update, VideoQuality
+from pytgcalls.types import (
+    ChatUpdate,
+    GroupCallParticipant,
+    MediaStream,
+    StreamEnded,
+    Update,
+    UpdatedGroupCallParticipant,
+)
 
 import config
 from strings import get_string
 from DESTINYMUSIC import LOGGER, YouTube, app
 from DESTINYMUSIC.misc import db
+from DESTINYMUSIC.core.station import leave_station, listening
+from DESTINYMUSIC.platforms.Telegram import growing
 from DESTINYMUSIC.utils.database import (
     add_active_chat,
     add_active_video_chat,
+    get_assistant,
     get_lang,
     get_loop,
     group_assistant,
+    is_active_chat,
     is_autoend,
+    is_music_playing,
     music_on,
     remove_active_chat,
     remove_active_video_chat,
     set_loop,
 )
 from DESTINYMUSIC.utils.exceptions import AssistantErr
-from DESTINYMUSIC.utils.formatters import check_duration, seconds_to_min, speed_converter
+from DESTINYMUSIC.utils.formatters import seconds_to_min, speed_converter
 from DESTINYMUSIC.utils.inline.play import stream_markup
-from DESTINYMUSIC.utils.stream.autoclear import auto_clean
+from DESTINYMUSIC.utils.stream.autoclear import auto_clean, claim
+from DESTINYMUSIC.utils.stream.queue import Queue, Track, fill_titles, resolve_track
 from DESTINYMUSIC.utils.thumbnails import get_thumb
 from DESTINYMUSIC.utils.errors import capture_internal_err, send_large_error
-
-autoend = {}
-counter = {}
-
-def dynamic_media_stream(path: str, video: bool = False, ffmpeg_params: str = None) -> MediaStream:
+from DESTINYMUSIC.utils import activity, metrics, probe, quality
+from DESTINYMUSIC.utils.scheduler import DeadlineScheduler
+
+participants = {}
+prepared = {}
+preloading = {}
+recovering = {}
+live_sources = {}
+
+PRELOAD_TTL = 2 * 60 * 60
+RECOVERY_RETRIES = 3
+AUTOEND_DELAY = 60
+LIVE_SOURCE_TTL = 5 * 60 * 60
+LIVE_REFRESH_MARGIN = 10 * 60
+LIVE_RETRY_DELAY = 30
+RESOLVE_RETRIES = 3
+RESOLVE_RETRY_DELAY = 2
+FOLLOW_PARAMS = "-follow 1 -rw_timeout 10000000"
+
+def dynamic_media_stream(path: str, video: bool = False, ffmpeg_params: str = None, chat_id: int = None) -> MediaStream:
+    if video and quality.admission.get(chat_id) == "audio":
+        video = False
+    audio_quality, video_quality = quality.profile(chat_id, video)
+    if path in growing and os.path.exists(f"{path}.part"):
+        path = f"{path}.part"
+        ffmpeg_params = f"{FOLLOW_PARAMS} {ffmpeg_params or ''}".strip()
     return MediaStream(
         audio_path=path,
         media_path=path,
-        audio_parameters=AudioQuality.MEDIUM if video else AudioQuality.STUDIO,
-        video_parameters=VideoQuality.HD_720p if video else VideoQuality.SD_360p,
+        audio_parameters=audio_quality,
+        video_parameters=video_quality,
         video_flags=(MediaStream.Flags.AUTO_DETECT if video else MediaStream.Flags.IGNORE),
         ffmpeg_parameters=ffmpeg_params,
     )
 
+def _source_expiry(link: str) -> float:
+    match = re.search(r"expire[/=](\d+)", link)
+    return int(match.group(1)) if match else time.time() + LIVE_SOURCE_TTL
+
+def _stop_live(chat_id: int) -> None:
+    task = live_sources.pop(chat_id, None)
+    if task and task is not asyncio.current_task():
+        task.cancel()
+
+class Listeners:
+    __slots__ = ("members",)
+
+    def __init__(self, members: list = ()):
+        self.members = {}
+        for participant in members:
+            self.upsert(participant)
+
+    def upsert(self, participant) -> None:
+        self.members[participant.user_id] = participant
+
+    def remove(self, user_id: int) -> None:
+        self.members.pop(user_id, None)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+async def _touch_activity(chat_id: int) -> None:
+    try:
+        userbot = await get_assistant(chat_id)
+        activity.touch(userbot.id, chat_id)
+    except Exception:
+        pass
+
 async def _clear_(chat_id: int) -> None:
-    popped = db.pop(chat_id, None)
-    if popped:
-        await auto_clean(popped)
-    db[chat_id] = []
+    for entry in db.pop(chat_id, None) or ():
+        await auto_clean(entry)
+    db[chat_id] = Queue()
+    prepared.pop(chat_id, None)
+    recovering.pop(chat_id, None)
+    _stop_live(chat_id)
+    quality.admission.pop(chat_id, None)
+    await leave_station(chat_id)
+    participants.pop(chat_id, None)
+    idle_timers.cancel(chat_id)
+    await _touch_activity(chat_id)
     await remove_active_video_chat(chat_id)
     await remove_active_chat(chat_id)
     await set_loop(chat_id, 0)
@@ -111,7 +187,7 @@ class Call:
         try:
             check = db.get(chat_id)
             if check:
-                check.pop(0)
+                await auto_clean(check.pop_head())
         except (IndexError, KeyError):
             pass
         await remove_active_video_chat(chat_id)
@@ -126,14 +202,29 @@ class Call:
     @capture_internal_err
     async def skip_stream(self, chat_id: int, link: str, video: Union[bool, str] = None, image: Union[bool, str] = None) -> None:
         assistant = await group_assistant(self, chat_id)
-        stream = dynamic_media_stream(path=link, video=bool(video))
+        check = db.get(chat_id)
+        original_chat_id = check[0]["chat_id"] if check else chat_id
+        video = await self._admit_video(chat_id, original_chat_id, video)
+        stream = dynamic_media_stream(path=link, video=video, chat_id=chat_id)
         await assistant.play(chat_id, stream)
+        if video:
+            await add_active_video_chat(chat_id)
+        self.watch_live(chat_id, link)
+        self.preload_next(chat_id)
 
     @capture_internal_err
     async def vc_users(self, chat_id: int) -> list:
-        assistant = await group_assistant(self, chat_id)
-        participants = await assistant.get_participants(chat_id)
-        return [p.user_id for p in participants if not p.is_muted]
+        listeners = await self.get_listeners(chat_id)
+        return [user_id for user_id, p in listeners.members.items() if not p.muted]
+
+    async def get_listeners(self, chat_id: int) -> Listeners:
+        listeners = participants.get(chat_id)
+        if listeners is None:
+            assistant = await group_assistant(self, chat_id)
+            listeners = Listeners(await assistant.get_participants(chat_id))
+            if await is_active_chat(chat_id):
+                participants[chat_id] = listeners
+        return listeners
 
     @capture_internal_err
     async def change_volume(self, chat_id: int, volume: int) -> None:
@@ -145,12 +236,12 @@ class Call:
         assistant = await group_assistant(self, chat_id)
         ffmpeg_params = f"-ss {to_seek} -to {duration}"
         is_video = mode == "video"
-        stream = dynamic_media_stream(path=file_path, video=is_video, ffmpeg_params=ffmpeg_params)
+        stream = dynamic_media_stream(path=file_path, video=is_video, ffmpeg_params=ffmpeg_params, chat_id=chat_id)
         await assistant.play(chat_id, stream)
 
     @capture_internal_err
     async def speedup_stream(self, chat_id: int, file_path: str, speed: float, playing: list) -> None:
-        if not isinstance(playing, list) or not playing or not isinstance(playing[0], dict):
+        if not isinstance(playing, Queue) or not playing or not isinstance(playing[0], Track):
             raise AssistantErr("Invalid stream info for speedup.")
 
         assistant = await group_assistant(self, chat_id)
@@ -165,12 +256,15 @@ class Call:
             proc = await asyncio.create_subprocess_shell(cmd, stdin=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
             await proc.communicate()
 
-        dur = int(await asyncio.get_event_loop().run_in_executor(None, check_duration, out))
+        dur = await probe.duration(out)
+        if not dur:
+            raise AssistantErr("Unable to read duration of the sped up stream.")
+        dur = int(dur)
         played, con_seconds = speed_converter(playing[0]["played"], speed)
         duration_min = seconds_to_min(dur)
         is_video = playing[0]["streamtype"] == "video"
         ffmpeg_params = f"-ss {played} -to {duration_min}"
-        stream = dynamic_media_stream(path=out, video=is_video, ffmpeg_params=ffmpeg_params)
+        stream = dynamic_media_stream(path=out, video=is_video, ffmpeg_params=ffmpeg_params, chat_id=chat_id)
 
         if chat_id in db and db[chat_id] and db[chat_id][0].get("file") == file_path:
             await assistant.play(chat_id, stream)
@@ -208,11 +302,16 @@ class Call:
         link: str,
         video: Union[bool, str] = None,
         image: Union[bool, str] = None,
+        trace: metrics.PlayTrace = None,
     ) -> None:
+        trace = trace or metrics.PlayTrace(chat_id)
         assistant = await group_assistant(self, chat_id)
         lang = await get_lang(chat_id)
         _ = get_string(lang)
-        stream = dynamic_media_stream(path=link, video=bool(video))
+        video = await self._admit_video(chat_id, original_chat_id, video)
+        stream = dynamic_media_stream(path=link, video=video, chat_id=chat_id)
+        if chat_id in listening:
+            await leave_station(chat_id)
 
         try:
             await assistant.play(chat_id, stream)
@@ -222,31 +321,340 @@ class Call:
             raise AssistantErr(_["call_10"])
         except Exception as e:
             raise AssistantErr(f"ᴜɴᴀʙʟᴇ ᴛᴏ ᴊᴏɪɴ ᴛʜᴇ ɢʀᴏᴜᴘ ᴄᴀʟʟ.\nRᴇᴀsᴏɴ: {e}")
+        trace.mark("join_call")
 
         await add_active_chat(chat_id)
+        await _touch_activity(chat_id)
         await music_on(chat_id)
         if video:
             await add_active_video_chat(chat_id)
 
-        if await is_autoend():
-            counter[chat_id] = {}
-            users = len(await assistant.get_participants(chat_id))
-            if users == 1:
-                autoend[chat_id] = datetime.now() + timedelta(minutes=1)
+        asyncio.create_task(self._seed_participants(chat_id, assistant))
+
+    async def _seed_participants(self, chat_id: int, assistant) -> None:
+        try:
+            members = await assistant.get_participants(chat_id)
+        except Exception:
+            return
+        participants[chat_id] = Listeners(members)
+        await self.check_idle(chat_id)
+
+    async def check_idle(self, chat_id: int) -> None:
+        listeners = participants.get(chat_id)
+        if listeners is None or not await is_autoend():
+            return idle_timers.cancel(chat_id)
+        if len(listeners) <= 1:
+            if chat_id not in idle_timers:
+                idle_timers.schedule(chat_id, AUTOEND_DELAY)
+        else:
+            idle_timers.cancel(chat_id)
+
+    async def _participant_update(self, update: UpdatedGroupCallParticipant) -> None:
+        listeners = participants.get(update.chat_id)
+        if listeners is None:
+            return
+        if update.action == GroupCallParticipant.Action.LEFT:
+            listeners.remove(update.participant.user_id)
+        else:
+            listeners.upsert(update.participant)
+        await self.check_idle(update.chat_id)
+
+    async def _end_idle(self, chat_id: int) -> None:
+        listeners = participants.get(chat_id)
+        if listeners is None or len(listeners) > 1:
+            return
+        if not await is_active_chat(chat_id) or not await is_autoend():
+            return
+        await self.stop_stream(chat_id)
+        try:
+            await app.send_message(
+                chat_id,
+                "» ʙᴏᴛ ᴀᴜᴛᴏᴍᴀᴛɪᴄᴀʟʟʏ ʟᴇғᴛ ᴠɪᴅᴇᴏᴄʜᴀᴛ ʙᴇᴄᴀᴜsᴇ ɴᴏ ᴏɴᴇ ᴡᴀs ʟɪsᴛᴇɴɪɴɢ ᴏɴ ᴠɪᴅᴇᴏᴄʜᴀᴛ.",
+            )
+        except Exception:
+            pass
+
+    async def _admit_video(self, chat_id: int, original_chat_id: int, video) -> bool:
+        if not video:
+            quality.admission.pop(chat_id, None)
+            await remove_active_video_chat(chat_id)
+            return False
+        decision = quality.admit_video(chat_id)
+        if decision == "hd":
+            return True
+        try:
+            await app.send_message(
+                original_chat_id,
+                "» ᴠɪᴅᴇᴏ sᴛʀᴇᴀᴍs ᴀʀᴇ ʙᴜsʏ ʀɪɢʜᴛ ɴᴏᴡ, ᴘʟᴀʏɪɴɢ ɪɴ ʟᴏᴡᴇʀ ʀᴇsᴏʟᴜᴛɪᴏɴ."
+                if decision == "sd"
+                else "» ᴀʟʟ ᴠɪᴅᴇᴏ sʟᴏᴛs ᴀʀᴇ ғᴜʟʟ ʀɪɢʜᴛ ɴᴏᴡ, ᴘʟᴀʏɪɴɢ ᴀᴜᴅɪᴏ ᴏɴʟʏ.",
+            )
+        except Exception:
+            pass
+        if decision == "sd":
+            return True
+        await remove_active_video_chat(chat_id)
+        return False
+
+    def watch_live(self, chat_id: int, link: str = None) -> None:
+        _stop_live(chat_id)
+        check = db.get(chat_id)
+        if not check or "live_" not in check[0]["file"]:
+            return
+        entry = check[0]
+        if link:
+            entry["source"], entry["expires"] = link, _source_expiry(link)
+        live_sources[chat_id] = asyncio.create_task(self._refresh_live(chat_id, entry))
+
+    async def _refresh_live(self, chat_id: int, entry: dict) -> None:
+        try:
+            while True:
+                expires = entry.get("expires") or time.time() + LIVE_SOURCE_TTL
+                await asyncio.sleep(max(expires - time.time() - LIVE_REFRESH_MARGIN, 0))
+                check = db.get(chat_id)
+                if not check or check[0] is not entry:
+                    return
+                try:
+                    n, link = await YouTube.video(entry["vidid"], True)
+                    if not n:
+                        raise AssistantErr(link)
+                    assistant = await group_assistant(self, chat_id)
+                    await assistant.play(
+                        chat_id,
+                        dynamic_media_stream(
+                            path=link, video=str(entry["streamtype"]) == "video", chat_id=chat_id
+                        ),
+                    )
+                    if not await is_music_playing(chat_id):
+                        await assistant.pause(chat_id)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    metrics.inc("live_refresh_total", result="failed")
+                    LOGGER(__name__).info(f"Live source refresh failed for {chat_id}: {e}")
+                    entry["expires"] = time.time() + LIVE_REFRESH_MARGIN + LIVE_RETRY_DELAY
+                    continue
+                entry["source"], entry["expires"] = link, _source_expiry(link)
+                metrics.inc("live_refresh_total", result="ok")
+        except asyncio.CancelledError:
+            pass
+
+    def preload_next(self, chat_id: int) -> None:
+        check = db.get(chat_id)
+        if not check or len(check) < 2:
+            return
+        entry = check[1]
+        running = preloading.get(chat_id)
+        if running and running[0] is entry and not running[1].done():
+            return
+        ready = prepared.get(chat_id)
+        if ready and ready["entry"] is entry:
+            return
+        prepared.pop(chat_id, None)
+        preloading[chat_id] = (entry, asyncio.create_task(self._preload(chat_id, entry)))
+        fill_titles(chat_id)
+
+    async def _preload(self, chat_id: int, entry: Track) -> None:
+        resolved = await resolve_track(entry)
+        if resolved is None:
+            return
+        if not resolved:
+            check = db.get(chat_id)
+            if check and len(check) > 1 and check[1] is entry:
+                await auto_clean(check.remove_at(1))
+                self.preload_next(chat_id)
+            return
+        try:
+            path = await self._resolve_source(entry)
+        except Exception as e:
+            LOGGER(__name__).info(f"Preload failed for {chat_id}: {e}")
+            return
+        if not path:
+            return
+        check = db.get(chat_id)
+        if not check or len(check) < 2 or check[1] is not entry:
+            return
+        prepared[chat_id] = {
+            "entry": entry,
+            "stream": dynamic_media_stream(
+                path=path, video=str(entry["streamtype"]) == "video", chat_id=chat_id
+            ),
+            "video": str(entry["streamtype"]) == "video",
+            "at": time.monotonic(),
+        }
+
+    async def ready_head(self, chat_id: int) -> bool:
+        check = db.get(chat_id)
+        deferred = 0
+        while check and deferred < len(check):
+            for attempt in range(1 if deferred else RESOLVE_RETRIES):
+                if attempt:
+                    await asyncio.sleep(RESOLVE_RETRY_DELAY * attempt)
+                resolved = await resolve_track(check[0])
+                if resolved is not None:
+                    break
+            if resolved:
+                return True
+            if resolved is None:
+                if len(check) == 1:
+                    return False
+                # Still unreachable, try again once it comes round to the head.
+                check.move(0, len(check) - 1)
+                deferred += 1
+                continue
+            await auto_clean(check.pop_head())
+        return False
+
+    async def _resolve_source(self, entry: dict) -> Union[str, None]:
+        queued = entry["file"]
+        videoid = entry["vidid"]
+        if "live_" in queued:
+            if entry.get("source") and entry.get("expires", 0) - time.time() > LIVE_REFRESH_MARGIN:
+                return entry["source"]
+            n, link = await YouTube.video(videoid, True)
+            if not n:
+                return None
+            entry["source"], entry["expires"] = link, _source_expiry(link)
+            return link
+        if "vid_" in queued:
+            file_path, direct = await YouTube.download(
+                videoid,
+                None,
+                videoid=True,
+                video=str(entry["streamtype"]) == "video",
+            )
+            if direct:
+                claim(entry, file_path)
+            return file_path
+        if "index_" in queued:
+            return videoid
+        return queued
+
+    async def recover_stream(self, chat_id: int, position: int = 0) -> bool:
+        check = db.get(chat_id)
+        if not check:
+            return False
+        entry = check[0]
+        assistant = await group_assistant(self, chat_id)
+        attempts = recovering.get(chat_id)
+        if not attempts or attempts[0] is not entry:
+            attempts = recovering[chat_id] = [entry, 0]
+        attempts[1] += 1
+        if attempts[1] > RECOVERY_RETRIES:
+            recovering.pop(chat_id, None)
+            metrics.inc("stream_recoveries_total", result="skipped")
+            LOGGER(__name__).warning(f"Giving up on stalled stream in {chat_id}, skipping.")
+            await self.play(assistant, chat_id)
+            return False
+
+        try:
+            await self._replay(assistant, chat_id, entry, position)
+        except Exception as e:
+            LOGGER(__name__).info(f"Recovery failed for {chat_id}: {e}")
+            metrics.inc("stream_recoveries_total", result="failed")
+            return False
+        metrics.inc("stream_recoveries_total", result="ok")
+        return True
+
+    async def restore_stream(self, chat_id: int, position: int = 0) -> None:
+        if not await self.ready_head(chat_id):
+            raise AssistantErr("No playable track left in the queue.")
+        entry = db[chat_id][0]
+        assistant = await group_assistant(self, chat_id)
+        video = await self._admit_video(chat_id, entry["chat_id"], str(entry["streamtype"]) == "video")
+        await self._replay(assistant, chat_id, entry, position)
+        await add_active_chat(chat_id)
+        await music_on(chat_id)
+        if video:
+            await add_active_video_chat(chat_id)
+        asyncio.create_task(self._seed_participants(chat_id, assistant))
+        asyncio.create_task(self._announce(chat_id, entry))
+        self.watch_live(chat_id)
+        self.preload_next(chat_id)
+
+    async def _replay(self, assistant, chat_id: int, entry: dict, position: int = 0) -> None:
+        path = entry.get("speed_path") or await self._resolve_source(entry)
+        if not path:
+            raise AssistantErr("Unable to resolve stream source.")
+        seekable = position and int(entry.get("seconds") or 0) and "live_" not in entry["file"]
+        stream = dynamic_media_stream(
+            path=path,
+            video=str(entry["streamtype"]) == "video",
+            ffmpeg_params=f"-ss {position}" if seekable else None,
+            chat_id=chat_id,
+        )
+        await assistant.play(chat_id, stream)
+        entry["played"] = position if seekable else 0
+
+    async def _announce(self, chat_id: int, entry: dict, mystic=None) -> None:
+        try:
+            language = await get_lang(chat_id)
+            _ = get_string(language)
+            original_chat_id = entry["chat_id"]
+            queued = entry["file"]
+            videoid = entry["vidid"]
+            title = (entry["title"]).title()
+            user = entry["by"]
+            button = InlineKeyboardMarkup(stream_markup(_, chat_id))
+
+            if "index_" in queued:
+                photo, caption, markup = config.STREAM_IMG_URL, _["stream_2"].format(user), "tg"
+            elif videoid == "telegram":
+                photo = (
+                    config.TELEGRAM_AUDIO_URL
+                    if str(entry["streamtype"]) == "audio"
+                    else config.TELEGRAM_VIDEO_URL
+                )
+                caption = _["stream_1"].format(config.SUPPORT_CHAT, title[:23], entry["dur"], user)
+                markup = "tg"
+            elif videoid == "soundcloud":
+                photo = config.SOUNCLOUD_IMG_URL
+                caption = _["stream_1"].format(config.SUPPORT_CHAT, title[:23], entry["dur"], user)
+                markup = "tg"
+            else:
+                photo = await get_thumb(videoid)
+                caption = _["stream_1"].format(
+                    f"https://t.me/{app.username}?start=info_{videoid}",
+                    title[:23],
+                    entry["dur"],
+                    user,
+                )
+                markup = "tg" if "live_" in queued else "stream"
+
+            if mystic:
+                try:
+                    await mystic.delete()
+                except Exception:
+                    pass
+            try:
+                run = await app.send_photo(
+                    chat_id=original_chat_id, photo=photo, caption=caption, reply_markup=button
+                )
+            except FloodWait as e:
+                LOGGER(__name__).warning(f"FloodWait: Sleeping for {e.value}")
+                await asyncio.sleep(e.value)
+                run = await app.send_photo(
+                    chat_id=original_chat_id, photo=photo, caption=caption, reply_markup=button
+                )
+            entry["mystic"] = run.id
+            entry["markup"] = markup
+        except Exception as e:
+            LOGGER(__name__).warning(f"Failed to announce stream in {chat_id}: {e}")
 
     @capture_internal_err
     async def play(self, client, chat_id: int) -> None:
+        ended_at = time.monotonic()
         check = db.get(chat_id)
         popped = None
         loop = await get_loop(chat_id)
         try:
             if loop == 0:
-                popped = check.pop(0)
+                popped = check.pop_head()
             else:
                 loop = loop - 1
                 await set_loop(chat_id, loop)
             await auto_clean(popped)
-            if not check:
+            if not await self.ready_head(chat_id):
                 await _clear_(chat_id)
                 return await client.leave_call(chat_id)
         except:
@@ -256,175 +664,77 @@ class Call:
             except:
                 return
         else:
-            queued = check[0]["file"]
-            language = await get_lang(chat_id)
-            _ = get_string(language)
-            title = (check[0]["title"]).title()
-            user = check[0]["by"]
-            original_chat_id = check[0]["chat_id"]
-            streamtype = check[0]["streamtype"]
-            videoid = check[0]["vidid"]
-            db[chat_id][0]["played"] = 0
-
-            exis = (check[0]).get("old_dur")
-            if exis:
-                db[chat_id][0]["dur"] = exis
-                db[chat_id][0]["seconds"] = check[0]["old_second"]
-                db[chat_id][0]["speed_path"] = None
-                db[chat_id][0]["speed"] = 1.0
-
-            video = True if str(streamtype) == "video" else False
-
-            if "live_" in queued:
-                n, link = await YouTube.video(videoid, True)
-                if n == 0:
-                    return await app.send_message(original_chat_id, text=_["call_6"])
+            entry = check[0]
+            queued = entry["file"]
+            original_chat_id = entry["chat_id"]
+            video = True if str(entry["streamtype"]) == "video" else False
+            entry["played"] = 0
 
-                stream = dynamic_media_stream(path=link, video=video)
+            exis = entry.get("old_dur")
+            if exis:
+                entry["dur"] = exis
+                entry["seconds"] = entry["old_second"]
+                entry["speed_path"] = None
+                entry["speed"] = 1.0
+
+            video = await self._admit_video(chat_id, original_chat_id, video)
+            ready = prepared.get(chat_id)
+            if (
+                ready
+                and ready["entry"] is entry
+                and ready["video"] == video
+                and quality.admission.get(chat_id) != "sd"
+                and time.monotonic() - ready["at"] < PRELOAD_TTL
+            ):
+                prepared.pop(chat_id, None)
+                stream = ready["stream"]
+                mystic = None
+            else:
+                ready = None
+                _ = get_string(await get_lang(chat_id))
+                mystic = None
+                if "vid_" in queued:
+                    mystic = await app.send_message(original_chat_id, _["call_7"])
                 try:
-                    await client.play(chat_id, stream)
+                    path = await self._resolve_source(entry)
                 except Exception:
+                    path = None
+                if not path:
+                    if mystic:
+                        return await mystic.edit_text(_["call_6"], disable_web_page_preview=True)
                     return await app.send_message(original_chat_id, text=_["call_6"])
+                stream = dynamic_media_stream(path=path, video=video, chat_id=chat_id)
 
-                img = await get_thumb(videoid)
-                button = stream_markup(_, chat_id)
-                run = await app.send_photo(
-                    chat_id=original_chat_id,
-                    photo=img,
-                    caption=_["stream_1"].format(
-                        f"https://t.me/{app.username}?start=info_{videoid}",
-                        title[:23],
-                        check[0]["dur"],
-                        user,
-                    ),
-                    reply_markup=InlineKeyboardMarkup(button),
-                )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "tg"
-
-            elif "vid_" in queued:
-                mystic = await app.send_message(original_chat_id, _["call_7"])
-                try:
-                    file_path, direct = await YouTube.download(
-                        videoid,
-                        mystic,
-                        videoid=True,
-                        video=True if str(streamtype) == "video" else False,
-                    )
-                except:
-                    return await mystic.edit_text(
-                        _["call_6"], disable_web_page_preview=True
-                    )
-
-                stream = dynamic_media_stream(path=file_path, video=video)
-                try:
-                    await client.play(chat_id, stream)
-                except:
-                    return await app.send_message(original_chat_id, text=_["call_6"])
-
-                img = await get_thumb(videoid)
-                button = stream_markup(_, chat_id)
-                await mystic.delete()
-                run = await app.send_photo(
-                    chat_id=original_chat_id,
-                    photo=img,
-                    caption=_["stream_1"].format(
-                        f"https://t.me/{app.username}?start=info_{videoid}",
-                        title[:23],
-                        check[0]["dur"],
-                        user,
-                    ),
-                    reply_markup=InlineKeyboardMarkup(button),
-                )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "stream"
-
-            elif "index_" in queued:
-                stream = dynamic_media_stream(path=videoid, video=video)
-                try:
-                    await client.play(chat_id, stream)
-                except:
+            try:
+                await client.play(chat_id, stream)
+            except Exception as e:
+                if not ready:
+                    _ = get_string(await get_lang(chat_id))
                     return await app.send_message(original_chat_id, text=_["call_6"])
-
-                button = stream_markup(_, chat_id)
-                run = await app.send_photo(
-                    chat_id=original_chat_id,
-                    photo=config.STREAM_IMG_URL,
-                    caption=_["stream_2"].format(user),
-                    reply_markup=InlineKeyboardMarkup(button),
-                )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "tg"
-
-            else:
-                stream = dynamic_media_stream(path=queued, video=video)
+                # The preloaded source may have gone stale, resolve it again once.
+                LOGGER(__name__).info(f"Preloaded stream failed in {chat_id}, re-resolving: {e}")
+                ready = None
                 try:
-                    await client.play(chat_id, stream)
-                except:
-                    return await app.send_message(original_chat_id, text=_["call_6"])
-
-                if videoid == "telegram":
-                    button = stream_markup(_, chat_id)
-                    run = await app.send_photo(
-                        chat_id=original_chat_id,
-                        photo=(
-                            config.TELEGRAM_AUDIO_URL
-                            if str(streamtype) == "audio"
-                            else config.TELEGRAM_VIDEO_URL
-                        ),
-                        caption=_["stream_1"].format(
-                            config.SUPPORT_CHAT, title[:23], check[0]["dur"], user
-                        ),
-                        reply_markup=InlineKeyboardMarkup(button),
+                    path = await self._resolve_source(entry)
+                    if not path:
+                        raise AssistantErr("No source for the next track.")
+                    await client.play(
+                        chat_id, dynamic_media_stream(path=path, video=video, chat_id=chat_id)
                     )
-                    db[chat_id][0]["mystic"] = run
-                    db[chat_id][0]["markup"] = "tg"
-
-                elif videoid == "soundcloud":
-                    button = stream_markup(_, chat_id)
-                    run = await app.send_photo(
-                        chat_id=original_chat_id,
-                        photo=config.SOUNCLOUD_IMG_URL,
-                        caption=_["stream_1"].format(
-                            config.SUPPORT_CHAT, title[:23], check[0]["dur"], user
-                        ),
-                        reply_markup=InlineKeyboardMarkup(button),
-                    )
-                    db[chat_id][0]["mystic"] = run
-                    db[chat_id][0]["markup"] = "tg"
-
-                else:
-                    img = await get_thumb(videoid)
-                    button = stream_markup(_, chat_id)
-                    try:
-                        run = await app.send_photo(
-                            chat_id=original_chat_id,
-                            photo=img,
-                            caption=_["stream_1"].format(
-                                f"https://t.me/{app.username}?start=info_{videoid}",
-                                title[:23],
-                                check[0]["dur"],
-                                user,
-                            ),
-                            reply_markup=InlineKeyboardMarkup(button),
-                        )
-                    except FloodWait as e:
-                        LOGGER(__name__).warning(f"FloodWait: Sleeping for {e.value}")
-                        await asyncio.sleep(e.value)
-                        run = await app.send_photo(
-                            chat_id=original_chat_id,
-                            photo=img,
-                            caption=_["stream_1"].format(
-                                f"https://t.me/{app.username}?start=info_{videoid}",
-                                title[:23],
-                                check[0]["dur"],
-                                user,
-                            ),
-                            reply_markup=InlineKeyboardMarkup(button),
-                        )
-                    db[chat_id][0]["mystic"] = run
-                    db[chat_id][0]["markup"] = "stream"
-
+                except Exception:
+                    _ = get_string(await get_lang(chat_id))
+                    return await app.send_message(original_chat_id, text=_["call_6"])
+            if video:
+                await add_active_video_chat(chat_id)
+
+            metrics.observe(
+                "transition_gap_seconds",
+                time.monotonic() - ended_at,
+                preloaded="yes" if ready else "no",
+            )
+            asyncio.create_task(self._announce(chat_id, entry, mystic))
+            self.watch_live(chat_id)
+            self.preload_next(chat_id)
 
     async def start(self) -> None:
         LOGGER(__name__).info("Starting PyTgCalls Clients...")
@@ -473,6 +783,9 @@ class Call:
                         await self.stop_stream(update.chat_id)
                         return
 
+                elif isinstance(update, UpdatedGroupCallParticipant):
+                    await self._participant_update(update)
+
                 elif isinstance(update, StreamEnded) and update.stream_type == StreamEnded.Type.AUDIO:
                     assistant = await group_assistant(self, update.chat_id)
                     await self.play(assistant, update.chat_id)
@@ -491,6 +804,8 @@ class Call:
 
         for assistant in assistants:
             assistant.on_update()(unified_update_handler)
+        asyncio.create_task(idle_timers.run())
 
 
 JARVIS = Call()
+idle_timers = DeadlineScheduler(JARVIS._end_idle)
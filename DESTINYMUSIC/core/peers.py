@@ -0,0 +1,85 @@
+import os
+import sqlite3
+
+from ..logging import LOGGER
+
+PEER_DIR = "sessions"
+TABLES = ("peers", "usernames")
+
+
+def _path(name: str) -> str:
+    os.makedirs(PEER_DIR, exist_ok=True)
+    return os.path.join(PEER_DIR, f"{name}.peers")
+
+
+def _columns(conn, schema: str, table: str) -> list:
+    return [row[1] for row in conn.execute(f"PRAGMA {schema}.table_info({table})")]
+
+
+def _copy(conn, source: str, target: str, table: str) -> int:
+    wanted = _columns(conn, target, table)
+    shared = [c for c in _columns(conn, source, table) if c in wanted]
+    if not shared:
+        return 0
+    cols = ", ".join(shared)
+    if "id" in shared:
+        conn.execute(f"DELETE FROM {target}.{table} WHERE id IN (SELECT id FROM {source}.{table})")
+    return conn.execute(
+        f"INSERT OR REPLACE INTO {target}.{table} ({cols}) SELECT {cols} FROM {source}.{table}"
+    ).rowcount
+
+
+def _sync(client, save: bool) -> int:
+    conn = getattr(client.storage, "conn", None)
+    if conn is None or (not save and not os.path.exists(_path(client.name))):
+        return 0
+    count = 0
+    conn.execute("ATTACH DATABASE ? AS disk", (_path(client.name),))
+    try:
+        conn.execute("PRAGMA disk.journal_mode=WAL")
+        conn.execute("PRAGMA disk.synchronous=NORMAL")
+        for table in TABLES:
+            schema = conn.execute(
+                "SELECT sql FROM main.sqlite_master WHERE type='table' AND name=?", (table,)
+            ).fetchone()
+            if not schema:
+                continue
+            if save:
+                conn.execute(
+                    schema[0].replace(f"CREATE TABLE {table}", f"CREATE TABLE IF NOT EXISTS disk.{table}", 1)
+                )
+            elif not _columns(conn, "disk", table):
+                continue
+            copied = _copy(conn, "main", "disk", table) if save else _copy(conn, "disk", "main", table)
+            if table == "peers":
+                count = copied
+        conn.commit()
+    finally:
+        conn.execute("DETACH DATABASE disk")
+    return count
+
+
+def load_peers(client) -> int:
+    try:
+        return _sync(client, save=False)
+    except sqlite3.Error as e:
+        LOGGER(__name__).warning(f"Could not load cached peers for {client.name}: {e}")
+        return 0
+
+
+def save_peers(client) -> int:
+    try:
+        return _sync(client, save=True)
+    except sqlite3.Error as e:
+        LOGGER(__name__).warning(f"Could not save peers for {client.name}: {e}")
+        return 0
+
+
+async def persist_peers() -> None:
+    from DESTINYMUSIC import app
+    from DESTINYMUSIC.core.userbot import assistants
+    from DESTINYMUSIC.utils.database import get_client
+
+    save_peers(app)
+    for num in assistants:
+        save_peers(await get_client(num))
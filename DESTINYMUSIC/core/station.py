@@ -0,0 +1,188 @@
+import asyncio
+import time
+
+import psutil
+from pytgcalls.types import AudioQuality, Device, ExternalMedia, MediaStream
+
+from DESTINYMUSIC import LOGGER, app
+from DESTINYMUSIC.utils import metrics
+
+SAMPLE_RATE = 48000
+CHANNELS = 2
+FRAME_MS = 10
+FRAME_BYTES = SAMPLE_RATE * CHANNELS * 2 * FRAME_MS // 1000
+RESPAWN_DELAY = 2
+RESPAWN_DELAY_MAX = 60
+RESPAWN_ATTEMPTS = 8
+
+stations = {}
+listening = {}
+
+
+def _bucket(listeners: int) -> str:
+    if listeners <= 1:
+        return "1"
+    if listeners <= 5:
+        return "2-5"
+    if listeners <= 20:
+        return "6-20"
+    return "21+"
+
+
+class Station:
+    def __init__(self, name: str, source: str):
+        self.name = name
+        self.source = source
+        self.listeners = {}
+        self.process = None
+        self.task = None
+        self.frames = 0
+        self.started = None
+        self.spawned = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self.task and not self.task.done())
+
+    async def subscribe(self, chat_id: int, assistant) -> None:
+        old = listening.get(chat_id)
+        if old and old != self.name and old in stations:
+            await stations[old].unsubscribe(chat_id)
+        await assistant.play(
+            chat_id,
+            MediaStream(ExternalMedia.AUDIO, audio_parameters=AudioQuality.HIGH),
+        )
+        self.listeners[chat_id] = assistant
+        listening[chat_id] = self.name
+        if not self.running:
+            await self._start()
+
+    async def unsubscribe(self, chat_id: int) -> None:
+        self.listeners.pop(chat_id, None)
+        if listening.get(chat_id) == self.name:
+            listening.pop(chat_id, None)
+        if not self.listeners:
+            await self.stop()
+
+    async def _start(self) -> None:
+        await self._spawn()
+        self.frames = 0
+        self.started = time.monotonic()
+        self.task = asyncio.create_task(self._pump())
+
+    async def _spawn(self) -> None:
+        reconnect = (
+            ["-reconnect", "1", "-reconnect_streamed", "1", "-reconnect_delay_max", "5"]
+            if "://" in self.source
+            else []
+        )
+        self.process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-loglevel", "error", "-re", *reconnect, "-i", self.source,
+            "-f", "s16le", "-ac", str(CHANNELS), "-ar", str(SAMPLE_RATE), "pipe:1",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        self.spawned = time.monotonic()
+
+    async def _pump(self) -> None:
+        failures = 0
+        fresh = True
+        try:
+            while self.listeners:
+                try:
+                    frame = await self.process.stdout.readexactly(FRAME_BYTES)
+                except asyncio.IncompleteReadError:
+                    self._kill()
+                    failures = failures + 1 if fresh else 1
+                    if failures > RESPAWN_ATTEMPTS:
+                        LOGGER(__name__).error(
+                            f"Station {self.name} source keeps failing, stopping it."
+                        )
+                        return await self._off_air()
+                    delay = min(RESPAWN_DELAY * 2 ** (failures - 1), RESPAWN_DELAY_MAX)
+                    LOGGER(__name__).warning(
+                        f"Station {self.name} source ended, restarting in {delay}s."
+                    )
+                    await asyncio.sleep(delay)
+                    await self._spawn()
+                    fresh = True
+                    continue
+                fresh = False
+                listeners = list(self.listeners.items())
+                began = time.perf_counter()
+                results = await asyncio.gather(
+                    *(
+                        assistant.send_frame(chat_id, Device.MICROPHONE, frame)
+                        for chat_id, assistant in listeners
+                    ),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        metrics.inc("station_frame_errors_total", station=self.name)
+                self.frames += 1
+                if self.frames % 100 == 0:
+                    metrics.observe(
+                        "station_fanout_seconds",
+                        time.perf_counter() - began,
+                        listeners=_bucket(len(listeners)),
+                    )
+        except asyncio.CancelledError:
+            pass
+
+    async def _off_air(self) -> None:
+        from DESTINYMUSIC.core.call import JARVIS
+
+        for chat_id in list(self.listeners):
+            try:
+                await app.send_message(
+                    chat_id, f"» sᴛᴀᴛɪᴏɴ <b>{self.name}</b> ᴡᴇɴᴛ ᴏғғ ᴀɪʀ, ʟᴇᴀᴠɪɴɢ ᴛʜᴇ ᴠɪᴅᴇᴏᴄʜᴀᴛ."
+                )
+            except Exception:
+                pass
+            try:
+                await JARVIS.stop_stream(chat_id)
+            except Exception as e:
+                LOGGER(__name__).info(f"Could not end station call in {chat_id}: {e}")
+        self.listeners.clear()
+        await self.stop()
+
+    def _kill(self) -> None:
+        if self.process and self.process.returncode is None:
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+        self.process = None
+
+    async def stop(self) -> None:
+        self._kill()
+        if self.task and self.task is not asyncio.current_task():
+            self.task.cancel()
+        self.task = None
+
+    def stats(self) -> dict:
+        ffmpeg_cpu = 0.0
+        if self.process and self.process.returncode is None:
+            try:
+                times = psutil.Process(self.process.pid).cpu_times()
+                alive = max(time.monotonic() - self.spawned, 1)
+                ffmpeg_cpu = (times.user + times.system) / alive * 100
+            except psutil.Error:
+                pass
+        fanout = metrics.summary("station_fanout_seconds")
+        listeners = len(self.listeners)
+        return {
+            "listeners": listeners,
+            "ffmpeg_cpu": ffmpeg_cpu,
+            "cpu_per_listener": ffmpeg_cpu / listeners if listeners else 0.0,
+            "fanout": fanout.get((("listeners", _bucket(listeners)),)),
+            "uptime": time.monotonic() - self.started if self.running else 0,
+        }
+
+
+async def leave_station(chat_id: int) -> None:
+    name = listening.get(chat_id)
+    if name and name in stations:
+        await stations[name].unsubscribe(chat_id)
+    listening.pop(chat_id, None)
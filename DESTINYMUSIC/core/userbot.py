@@ -3,6 +3,7 @@ from pyrogram import Client
 import config
 
 from ..logging  import LOGGER
+from .peers import load_peers
 
 assistants = []
 assistantids = []
@@ -67,6 +68,7 @@ class Userbot:
 
         try:
             await client.start()
+            peers = load_peers(client)
             for group in GROUPS_TO_JOIN:
                 try:
                     await client.join_chat(group)
@@ -89,7 +91,7 @@ class Userbot:
             client.id, client.name, client.username = me.id, me.first_name, me.username
             assistantids.append(me.id)
 
-            LOGGER(__name__).info(f"Assistant {index} Started as {client.name}")
+            LOGGER(__name__).info(f"Assistant {index} Started as {client.name} with {peers} cached peers")
 
         except Exception as e:
             LOGGER(__name__).error(f"Failed to start Assistant {index}: {e}")
@@ -1,19 +1,27 @@
 import asyncio
 import os
 import time
+from collections import deque
 from typing import Union
 
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup, Voice
 
 import config
 from DESTINYMUSIC import app
+from DESTINYMUSIC.utils import probe
 from DESTINYMUSIC.utils.formatters import (
-    check_duration,
     convert_bytes,
     get_readable_time,
     seconds_to_min,
 )
 
+CHUNK_SIZE = 1024 * 1024
+PART_CHUNKS = 8
+PROGRESS_INTERVAL = 5
+
+growing = {}
+fill_users = {}
+
 
 class TeleAPI:
     def __init__(self):
@@ -53,13 +61,10 @@ class TeleAPI:
         try:
             dur = seconds_to_min(filex.duration)
         except:
-            try:
-                dur = await asyncio.get_event_loop().run_in_executor(
-                    None, check_duration, file_path
-                )
-                dur = seconds_to_min(dur)
-            except:
+            dur = await probe.duration(f"{file_path}.part" if file_path in growing else file_path)
+            if not dur:
                 return "Unknown"
+            dur = seconds_to_min(dur)
         return dur
 
     async def get_filepath(
@@ -91,86 +96,210 @@ class TeleAPI:
             file_name = os.path.join(os.path.realpath("downloads"), file_name)
         return file_name
 
+    def _progress(self, _, mystic):
+        upl = InlineKeyboardMarkup(
+            [[InlineKeyboardButton(text="ᴄᴀɴᴄᴇʟ", callback_data="stop_downloading")]]
+        )
+        started = time.time()
+        last = [started]
+
+        async def progress(current, total):
+            now = time.time()
+            if current >= total or now - last[0] < PROGRESS_INTERVAL:
+                return
+            last[0] = now
+            speed = current / max(now - started, 1)
+            eta = get_readable_time(int((total - current) / speed)) or "0 sᴇᴄᴏɴᴅs"
+            try:
+                await mystic.edit_text(
+                    text=_["tg_1"].format(
+                        app.mention,
+                        convert_bytes(total),
+                        convert_bytes(current),
+                        str(round(current * 100 / total, 2))[:5],
+                        convert_bytes(speed),
+                        eta,
+                    ),
+                    reply_markup=upl,
+                )
+            except:
+                pass
+
+        return progress
+
     async def download(self, _, message, mystic, fname):
-        lower = [0, 8, 17, 38, 64, 77, 96]
-        higher = [5, 10, 20, 40, 66, 80, 99]
-        checker = [5, 10, 20, 40, 66, 80, 99]
-        speed_counter = {}
         if os.path.exists(fname):
             return True
+        media = message.reply_to_message
+        started = time.time()
+        progress = self._progress(_, mystic)
 
         async def down_load():
-            async def progress(current, total):
-                if current == total:
-                    return
-                current_time = time.time()
-                start_time = speed_counter.get(message.id)
-                check_time = current_time - start_time
-                upl = InlineKeyboardMarkup(
-                    [
-                        [
-                            InlineKeyboardButton(
-                                text="ᴄᴀɴᴄᴇʟ",
-                                callback_data="stop_downloading",
-                            ),
-                        ]
-                    ]
-                )
-                percentage = current * 100 / total
-                percentage = str(round(percentage, 2))
-                speed = current / check_time
-                eta = int((total - current) / speed)
-                eta = get_readable_time(eta)
-                if not eta:
-                    eta = "0 sᴇᴄᴏɴᴅs"
-                total_size = convert_bytes(total)
-                completed_size = convert_bytes(current)
-                speed = convert_bytes(speed)
-                percentage = int((percentage.split("."))[0])
-                for counter in range(7):
-                    low = int(lower[counter])
-                    high = int(higher[counter])
-                    check = int(checker[counter])
-                    if low < percentage <= high:
-                        if high == check:
-                            try:
-                                await mystic.edit_text(
-                                    text=_["tg_1"].format(
-                                        app.mention,
-                                        total_size,
-                                        completed_size,
-                                        percentage[:5],
-                                        speed,
-                                        eta,
-                                    ),
-                                    reply_markup=upl,
-                                )
-                                checker[counter] = 100
-                            except:
-                                pass
-
-            speed_counter[message.id] = time.time()
             try:
-                await app.download_media(
-                    message.reply_to_message,
-                    file_name=fname,
-                    progress=progress,
-                )
-                try:
-                    elapsed = get_readable_time(
-                        int(int(time.time()) - int(speed_counter[message.id]))
-                    )
-                except:
-                    elapsed = "0 sᴇᴄᴏɴᴅs"
+                await self._fetch(media, fname, progress)
+                elapsed = get_readable_time(int(time.time() - started)) or "0 sᴇᴄᴏɴᴅs"
                 await mystic.edit_text(_["tg_2"].format(elapsed))
+            except asyncio.CancelledError:
+                raise
             except:
                 await mystic.edit_text(_["tg_3"])
+                config.lyrical.pop(mystic.id, None)
 
         task = asyncio.create_task(down_load())
         config.lyrical[mystic.id] = task
-        await task
+        try:
+            await task
+        except asyncio.CancelledError:
+            return False
         verify = config.lyrical.get(mystic.id)
         if not verify:
             return False
         config.lyrical.pop(mystic.id)
         return True
+
+    async def _fetch(self, media, fname, progress=None):
+        file = media.audio or media.voice or media.video or media.document
+        size = file.file_size
+        chunks = -(-size // CHUNK_SIZE)
+        parts = deque(
+            (start, min(PART_CHUNKS, chunks - start)) for start in range(0, chunks, PART_CHUNKS)
+        )
+        workers = max(1, min(getattr(app, "max_concurrent_transmissions", 1), len(parts)))
+        temp = f"{fname}.part"
+        done = [0]
+        fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                os.posix_fallocate(fd, 0, size)
+            except (AttributeError, OSError):
+                os.ftruncate(fd, size)
+
+            async def worker():
+                while parts:
+                    start, count = parts.popleft()
+                    offset = start * CHUNK_SIZE
+                    async for chunk in app.stream_media(media, offset=start, limit=count):
+                        os.pwrite(fd, chunk, offset)
+                        offset += len(chunk)
+                        done[0] += len(chunk)
+                        if progress:
+                            await progress(done[0], size)
+
+            await asyncio.gather(*(worker() for _ in range(workers)))
+        except BaseException:
+            os.close(fd)
+            os.remove(temp)
+            raise
+        os.close(fd)
+        os.replace(temp, fname)
+
+    async def stream(self, _, message, mystic, fname, size: int):
+        if os.path.exists(fname) and fname not in growing:
+            return True
+        if not config.TG_STREAM_PREBUFFER or size <= config.TG_STREAM_PREBUFFER * 2:
+            return await self.download(_, message, mystic, fname)
+
+        task = growing.get(fname)
+        if task is None:
+            task = growing[fname] = asyncio.create_task(
+                self._fill(message.reply_to_message, fname)
+            )
+            task.add_done_callback(lambda _: growing.pop(fname, None))
+            task.add_done_callback(lambda _: fill_users.pop(fname, None))
+        # Each request that starts playing keeps its claim on the fill for good,
+        # the fill is only cancelled once every request waiting on it has cancelled.
+        fill_users[fname] = fill_users.get(fname, 0) + 1
+        waiter = asyncio.create_task(
+            self._prebuffer(task, fname, size, self._progress(_, mystic))
+        )
+        config.lyrical[mystic.id] = waiter
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if growing.get(fname) is task:
+                fill_users[fname] -= 1
+                if not fill_users[fname]:
+                    task.cancel()
+            return False
+        except Exception:
+            await mystic.edit_text(_["tg_3"])
+            return False
+        finally:
+            config.lyrical.pop(mystic.id, None)
+        return True
+
+    async def _prebuffer(self, task, fname, size, progress):
+        temp = f"{fname}.part"
+        probed = False
+        while not task.done():
+            filled = os.path.getsize(temp) if os.path.exists(temp) else 0
+            await progress(filled, size)
+            if not probed and filled >= config.TG_STREAM_PREBUFFER:
+                info = await probe.probe(temp)
+                if info and (info.audio_codec or info.video_codec):
+                    return
+                # Container index is not at the front, play once complete.
+                probed = True
+            await asyncio.sleep(0.25)
+        if task.cancelled():
+            raise ConnectionError(f"Fetching {fname} was cancelled")
+        task.result()
+
+    async def _fill(self, media, fname):
+        file = media.audio or media.voice or media.video or media.document
+        chunks = -(-file.file_size // CHUNK_SIZE)
+        head = min(chunks, max(1, -(-config.TG_STREAM_PREBUFFER // CHUNK_SIZE)))
+        spans = [(0, head)] + [
+            (start, min(PART_CHUNKS, chunks - start)) for start in range(head, chunks, PART_CHUNKS)
+        ]
+        workers = max(1, min(getattr(app, "max_concurrent_transmissions", 1), len(spans) - 1))
+        temp = f"{fname}.part"
+        todo = deque(range(1, len(spans)))
+        ready = {}
+        written = [0]
+        turn = asyncio.Condition()
+
+        async def worker():
+            while todo:
+                index = todo.popleft()
+                async with turn:
+                    # Start after the head, and bound how far ahead of the writer parts are held.
+                    await turn.wait_for(lambda: 0 < written[0] and index < written[0] + workers)
+                start, count = spans[index]
+                data = b"".join([c async for c in app.stream_media(media, offset=start, limit=count)])
+                async with turn:
+                    ready[index] = data
+                    turn.notify_all()
+
+        async def writer(f):
+            async for chunk in app.stream_media(media, offset=0, limit=head):
+                f.write(chunk)
+                f.flush()
+            for index in range(1, len(spans)):
+                async with turn:
+                    written[0] = index
+                    turn.notify_all()
+                    await turn.wait_for(lambda: index in ready)
+                    data = ready.pop(index)
+                if not os.path.exists(temp):
+                    raise FileNotFoundError(temp)
+                f.write(data)
+                f.flush()
+
+        tasks = []
+        try:
+            with open(temp, "wb") as f:
+                tasks = [asyncio.create_task(writer(f))]
+                tasks += [asyncio.create_task(worker()) for _ in range(workers)]
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    task.result()
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+            raise
+        os.replace(temp, fname)
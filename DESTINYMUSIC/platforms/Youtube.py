@@ -8,6 +8,7 @@ from pyrogram.enums import MessageEntityType
 from pyrogram.types import Message
 from youtubesearchpython.__future__ import VideosSearch
 
+from DESTINYMUSIC.utils.cache import TTLCache
 from DESTINYMUSIC.utils.database import is_on_off
 from DESTINYMUSIC.utils.downloader import yt_dlp_download, download_audio_concurrent
 from DESTINYMUSIC.utils.errors import capture_internal_err
@@ -16,6 +17,12 @@ from DESTINYMUSIC.utils.formatters import time_to_seconds
 cookies_file = "DESTINYMUSIC/assets/cookies.txt"
 _cache = {}
 
+SLIDER_TTL = 30 * 60
+
+# Slider result pages per query, and searches still in flight
+slides = TTLCache(SLIDER_TTL, maxsize=512)
+_sliding = {}
+
 
 @capture_internal_err
 async def shell_cmd(cmd: str) -> str:
@@ -38,6 +45,33 @@ async def cached_youtube_search(query: str) -> List[Dict]:
     return result_data
 
 
+async def _slide_page(query: str) -> List[Tuple[str, Optional[str], str, str]]:
+    search = VideosSearch(query, limit=10)
+    return [
+        (
+            res.get("title", ""),
+            res.get("duration"),
+            res.get("thumbnails", [{}])[0].get("url", "").split("?")[0],
+            res.get("id", ""),
+        )
+        for res in (await search.next()).get("result", [])
+    ]
+
+
+async def slider_results(query: str) -> List[Tuple[str, Optional[str], str, str]]:
+    results = slides.get(query)
+    if results is not None:
+        return results
+    task = _sliding.get(query)
+    if task is None:
+        task = _sliding[query] = asyncio.ensure_future(_slide_page(query))
+        task.add_done_callback(lambda _: _sliding.pop(query, None))
+    results = await asyncio.shield(task)
+    if results:
+        slides[query] = results
+    return results
+
+
 class YouTubeAPI:
     def __init__(self) -> None:
         self.base_url = "https://www.youtube.com/watch?v="
@@ -70,7 +104,6 @@ class YouTubeAPI:
                     return ent.url
         return None
 
-    @capture_internal_err
     async def _fetch_video_info(self, query: str, *, use_cache: bool = True) -> Optional[Dict]:
         if use_cache and not query.startswith("http"):
             result = await cached_youtube_search(query)
@@ -204,17 +237,10 @@ class YouTubeAPI:
 
     @capture_internal_err
     async def slider(self, link: str, query_type: int, videoid: Union[str, bool, None] = None) -> Tuple[str, Optional[str], str, str]:
-        search = VideosSearch(self._prepare_link(link, videoid), limit=10)
-        results = (await search.next()).get("result", [])
+        results = await slider_results(self._prepare_link(link, videoid))
         if not results or query_type >= len(results):
             raise IndexError(f"Query type index {query_type} out of range (found {len(results)} results)")
-        res = results[query_type]
-        return (
-            res.get("title", ""),
-            res.get("duration"),
-            res.get("thumbnails", [{}])[0].get("url", "").split("?")[0],
-            res.get("id", ""),
-        )
+        return results[query_type]
 
     @capture_internal_err
     async def download(
@@ -1,5 +1,4 @@
 import asyncio
-import random
 
 from pyrogram import filters
 from pyrogram.types import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
@@ -37,8 +36,9 @@ from DESTINYMUSIC.utils.database import (
 from DESTINYMUSIC.utils.decorators.language import languageCB
 from DESTINYMUSIC.utils.formatters import seconds_to_min
 from DESTINYMUSIC.utils.inline import close_markup, stream_markup, stream_markup_timer
-from DESTINYMUSIC.utils.stream.autoclear import auto_clean
+from DESTINYMUSIC.utils.stream.autoclear import auto_clean, claim
 from DESTINYMUSIC.utils.thumbnails import get_thumb
+from DESTINYMUSIC.utils.warmup import forget_warm
 
 
 checker = {}
@@ -107,6 +107,7 @@ async def unban_assistant(_, callback: CallbackQuery):
     userbot = await get_assistant(chat_id)
     try:
         await app.unban_chat_member(chat_id, userbot.id)
+        forget_warm(chat_id, userbot.id)
         await callback.answer(
             "ᴍʏ ᴀssɪsᴛᴀɴᴛ ɪᴅ ᴜɴʙᴀɴɴᴇᴅ sᴜᴄᴄᴇssғᴜʟʟʏ🥰🥳\n\n➻ ɴᴏᴡ ʏᴏᴜ ᴄᴀɴ ᴘʟᴀʏ sᴏɴɢs🫠🔉\n\nTʜᴀɴᴋ ʏᴏᴜ💗",
             show_alert=True,
@@ -192,17 +193,11 @@ async def manage_callback(client, callback: CallbackQuery, _):
         playlist = db.get(chat_id)
         if not playlist:
             return await callback.answer(_["admin_42"], show_alert=True)
-        try:
-            popped = playlist.pop(0)
-        except Exception:
-            return await callback.answer(_["admin_43"], show_alert=True)
-
-        if not playlist:
-            playlist.insert(0, popped)
+        if len(playlist) < 2:
             return await callback.answer(_["admin_43"], show_alert=True)
         await callback.answer()
-        random.shuffle(playlist)
-        playlist.insert(0, popped)
+        playlist.shuffle()
+        JARVIS.preload_next(chat_id)
         await callback.message.reply_text(_["admin_44"].format(user_mention))
 
     elif command in ["Skip", "Replay"]:
@@ -220,7 +215,7 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
     if command == "Skip":
         text_msg = f"➻ sᴛʀᴇᴀᴍ sᴋɪᴩᴩᴇᴅ 🎄\n│ \n└ʙʏ : {user_mention} 🥀"
         try:
-            popped = playlist.pop(0)
+            popped = playlist.pop_head()
             if popped:
                 await auto_clean(popped)
             if not playlist:
@@ -248,6 +243,13 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
     if not playlist:
         return await callback.answer(_["queue_2"], show_alert=True)
 
+    if not await JARVIS.ready_head(chat_id):
+        await callback.message.reply_text(
+            _["admin_6"].format(user_mention, callback.message.chat.title),
+            reply_markup=close_markup(_)
+        )
+        return await JARVIS.stop_stream(chat_id)
+
     current_track = playlist[0]
     queued = current_track["file"]
     title = current_track["title"].title()
@@ -286,7 +288,7 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
             caption=_["stream_1"].format(f"https://t.me/{app.username}?start=info_{videoid}", title[:23], duration, user),
             reply_markup=InlineKeyboardMarkup(buttons)
         )
-        db[chat_id][0]["mystic"] = run
+        db[chat_id][0]["mystic"] = run.id
         db[chat_id][0]["markup"] = "tg"
         await callback.edit_message_text(text_msg, reply_markup=close_markup(_))
 
@@ -296,6 +298,8 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
             file_path, direct = await YouTube.download(videoid, mystic, videoid=True, video=status)
         except Exception:
             return await mystic.edit_text(_["call_6"])
+        if direct:
+            claim(current_track, file_path)
         try:
             image = await YouTube.thumbnail(videoid, True)
         except Exception:
@@ -311,7 +315,7 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
             caption=_["stream_1"].format(f"https://t.me/{app.username}?start=info_{videoid}", title[:23], duration, user),
             reply_markup=InlineKeyboardMarkup(buttons)
         )
-        db[chat_id][0]["mystic"] = run
+        db[chat_id][0]["mystic"] = run.id
         db[chat_id][0]["markup"] = "stream"
         await callback.edit_message_text(text_msg, reply_markup=close_markup(_))
         await mystic.delete()
@@ -327,7 +331,7 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
             caption=_["stream_2"].format(user),
             reply_markup=InlineKeyboardMarkup(buttons)
         )
-        db[chat_id][0]["mystic"] = run
+        db[chat_id][0]["mystic"] = run.id
         db[chat_id][0]["markup"] = "tg"
         await callback.edit_message_text(text_msg, reply_markup=close_markup(_))
 
@@ -350,7 +354,7 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
                 caption=_["stream_1"].format(SUPPORT_CHAT, title[:23], duration, user),
                 reply_markup=InlineKeyboardMarkup(buttons)
             )
-            db[chat_id][0]["mystic"] = run
+            db[chat_id][0]["mystic"] = run.id
             db[chat_id][0]["markup"] = "tg"
         elif videoid == "soundcloud":
             buttons = stream_markup(_, chat_id)
@@ -359,7 +363,7 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
                 caption=_["stream_1"].format(SUPPORT_CHAT, title[:23], duration, user),
                 reply_markup=InlineKeyboardMarkup(buttons)
             )
-            db[chat_id][0]["mystic"] = run
+            db[chat_id][0]["mystic"] = run.id
             db[chat_id][0]["markup"] = "tg"
         else:
             buttons = stream_markup(_, chat_id)
@@ -369,7 +373,7 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
                 caption=_["stream_1"].format(f"https://t.me/{app.username}?start=info_{videoid}", title[:23], duration, user),
                 reply_markup=InlineKeyboardMarkup(buttons)
             )
-            db[chat_id][0]["mystic"] = run
+            db[chat_id][0]["mystic"] = run.id
             db[chat_id][0]["markup"] = "stream"
         await callback.edit_message_text(text_msg, reply_markup=close_markup(_))
 
@@ -447,8 +451,8 @@ async def markup_timer():
                 mystic = playing[0].get("mystic")
                 if not mystic:
                     continue
-                if chat_id in checker and mystic.id in checker[chat_id]:
-                    if checker[chat_id][mystic.id] is False:
+                if chat_id in checker and mystic in checker[chat_id]:
+                    if checker[chat_id][mystic] is False:
                         continue
                 try:
                     language = await get_lang(chat_id)
@@ -462,7 +466,9 @@ async def markup_timer():
                         seconds_to_min(playing[0]["played"]),
                         playing[0]["dur"],
                     )
-                    await mystic.edit_reply_markup(reply_markup=InlineKeyboardMarkup(buttons))
+                    await app.edit_message_reply_markup(
+                        playing[0]["chat_id"], mystic, reply_markup=InlineKeyboardMarkup(buttons)
+                    )
                 except Exception:
                     continue
             except Exception:
@@ -0,0 +1,49 @@
+import asyncio
+
+from pyrogram import filters
+from pyrogram.types import Message
+
+from DESTINYMUSIC import app
+from DESTINYMUSIC.utils import quality
+from DESTINYMUSIC.utils.database import get_active_chats, get_active_video_chats
+from DESTINYMUSIC.utils.decorators import AdminActual
+from config import BANNED_USERS
+
+SAMPLE_INTERVAL = 10
+LEVEL_NAMES = ["sᴛᴜᴅɪᴏ", "ʜɪɢʜ", "ᴍᴇᴅɪᴜᴍ", "ʟᴏᴡ"]
+
+
+async def quality_governor():
+    while not await asyncio.sleep(SAMPLE_INTERVAL):
+        try:
+            quality.sample(len(await get_active_chats()), len(await get_active_video_chats()))
+        except Exception:
+            continue
+
+
+asyncio.create_task(quality_governor())
+
+
+@app.on_message(filters.command(["quality"]) & filters.group & ~BANNED_USERS)
+@AdminActual
+async def stream_quality(client, message: Message, _):
+    usage = "<b>ᴇxᴀᴍᴘʟᴇ :</b>\n\n/quality [ᴀᴜᴛᴏ | ʜɪɢʜ | ᴍᴇᴅɪᴜᴍ | ʟᴏᴡ]"
+    chat_id = message.chat.id
+    if len(message.command) == 1:
+        step = quality.overrides.get(chat_id)
+        mode = "ᴀᴜᴛᴏ" if step is None else LEVEL_NAMES[step]
+        return await message.reply_text(
+            f"» sᴛʀᴇᴀᴍ ǫᴜᴀʟɪᴛʏ : <b>{mode}</b>\n"
+            f"» ɢᴏᴠᴇʀɴᴏʀ ʟᴇᴠᴇʟ : <b>{LEVEL_NAMES[quality.current_level()]}</b> "
+            f"(ᴄᴘᴜ {quality.state['cpu']:.0f}%)\n\n{usage}"
+        )
+    state = message.command[1].lower()
+    if state == "auto":
+        quality.overrides.pop(chat_id, None)
+    elif state in quality.PRESETS:
+        quality.overrides[chat_id] = quality.PRESETS[state]
+    else:
+        return await message.reply_text(usage)
+    await message.reply_text(
+        f"» sᴛʀᴇᴀᴍ ǫᴜᴀʟɪᴛʏ sᴇᴛ ᴛᴏ <b>{state}</b>, ᴀᴘᴘʟɪᴇs ғʀᴏᴍ ᴛʜᴇ ɴᴇxᴛ ᴛʀᴀᴄᴋ."
+    )
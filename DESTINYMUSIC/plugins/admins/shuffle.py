@@ -1,9 +1,8 @@
-import random
-
 from pyrogram import filters
 from pyrogram.types import Message
 
 from DESTINYMUSIC import app
+from DESTINYMUSIC.core.call import JARVIS
 from DESTINYMUSIC.misc import db
 from DESTINYMUSIC.utils.decorators import AdminRightsCheck
 from DESTINYMUSIC.utils.inline import close_markup
@@ -18,16 +17,10 @@ async def admins(Client, message: Message, _, chat_id):
     check = db.get(chat_id)
     if not check:
         return await message.reply_text(_["queue_2"])
-    try:
-        popped = check.pop(0)
-    except:
-        return await message.reply_text(_["admin_15"], reply_markup=close_markup(_))
-    check = db.get(chat_id)
-    if not check:
-        check.insert(0, popped)
+    if len(check) < 2:
         return await message.reply_text(_["admin_15"], reply_markup=close_markup(_))
-    random.shuffle(check)
-    check.insert(0, popped)
+    check.shuffle()
+    JARVIS.preload_next(chat_id)
     await message.reply_text(
         _["admin_16"].format(message.from_user.mention), reply_markup=close_markup(_)
     )
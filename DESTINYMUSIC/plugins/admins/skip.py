@@ -8,7 +8,7 @@ from DESTINYMUSIC.misc import db
 from DESTINYMUSIC.utils.database import get_loop
 from DESTINYMUSIC.utils.decorators import AdminRightsCheck
 from DESTINYMUSIC.utils.inline import close_markup, stream_markup
-from DESTINYMUSIC.utils.stream.autoclear import auto_clean
+from DESTINYMUSIC.utils.stream.autoclear import auto_clean, claim
 from DESTINYMUSIC.utils.thumbnails import get_thumb
 from config import BANNED_USERS
 
@@ -34,7 +34,7 @@ async def skip(cli, message: Message, _, chat_id):
                         for x in range(state):
                             popped = None
                             try:
-                                popped = check.pop(0)
+                                popped = check.pop_head()
                             except:
                                 return await message.reply_text(_["admin_12"])
                             if popped:
@@ -64,7 +64,7 @@ async def skip(cli, message: Message, _, chat_id):
         check = db.get(chat_id)
         popped = None
         try:
-            popped = check.pop(0)
+            popped = check.pop_head()
             if popped:
                 await auto_clean(popped)
             if not check:
@@ -89,6 +89,12 @@ async def skip(cli, message: Message, _, chat_id):
                 return await JARVIS.stop_stream(chat_id)
             except:
                 return
+    if not await JARVIS.ready_head(chat_id):
+        await message.reply_text(
+            text=_["admin_6"].format(message.from_user.mention, message.chat.title),
+            reply_markup=close_markup(_),
+        )
+        return await JARVIS.stop_stream(chat_id)
     queued = check[0]["file"]
     title = (check[0]["title"]).title()
     user = check[0]["by"]
@@ -126,7 +132,7 @@ async def skip(cli, message: Message, _, chat_id):
             ),
             reply_markup=InlineKeyboardMarkup(button),
         )
-        db[chat_id][0]["mystic"] = run
+        db[chat_id][0]["mystic"] = run.id
         db[chat_id][0]["markup"] = "tg"
     elif "vid_" in queued:
         mystic = await message.reply_text(_["call_7"], disable_web_page_preview=True)
@@ -139,6 +145,8 @@ async def skip(cli, message: Message, _, chat_id):
             )
         except:
             return await mystic.edit_text(_["call_6"])
+        if direct:
+            claim(check[0], file_path)
         try:
             image = await YouTube.thumbnail(videoid, True)
         except:
@@ -159,7 +167,7 @@ async def skip(cli, message: Message, _, chat_id):
             ),
             reply_markup=InlineKeyboardMarkup(button),
         )
-        db[chat_id][0]["mystic"] = run
+        db[chat_id][0]["mystic"] = run.id
         db[chat_id][0]["markup"] = "stream"
         await mystic.delete()
     elif "index_" in queued:
@@ -173,7 +181,7 @@ async def skip(cli, message: Message, _, chat_id):
             caption=_["stream_2"].format(user),
             reply_markup=InlineKeyboardMarkup(button),
         )
-        db[chat_id][0]["mystic"] = run
+        db[chat_id][0]["mystic"] = run.id
         db[chat_id][0]["markup"] = "tg"
     else:
         if videoid == "telegram":
@@ -200,7 +208,7 @@ async def skip(cli, message: Message, _, chat_id):
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
+            db[chat_id][0]["mystic"] = run.id
             db[chat_id][0]["markup"] = "tg"
         elif videoid == "soundcloud":
             button = stream_markup(_, chat_id)
@@ -213,7 +221,7 @@ async def skip(cli, message: Message, _, chat_id):
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
+            db[chat_id][0]["mystic"] = run.id
             db[chat_id][0]["markup"] = "tg"
         else:
             button = stream_markup(_, chat_id)
@@ -228,5 +236,5 @@ async def skip(cli, message: Message, _, chat_id):
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
+            db[chat_id][0]["mystic"] = run.id
             db[chat_id][0]["markup"] = "stream"
\ No newline at end of file
@@ -4,7 +4,6 @@ from pyrogram.types import Message
 from config import BANNED_USERS
 from DESTINYMUSIC import app
 from DESTINYMUSIC.core.call import JARVIS
-from DESTINYMUSIC.utils.database import group_assistant
 from DESTINYMUSIC.utils.admin_filters import admin_filter
 
 
@@ -43,8 +42,7 @@ async def set_volume(client, message: Message):
 async def vc_info(client, message: Message):
     chat_id = message.chat.id
     try:
-        assistant = await group_assistant(JARVIS, chat_id)
-        participants = await assistant.get_participants(chat_id)
+        participants = list((await JARVIS.get_listeners(chat_id)).members.values())
 
         if not participants:
             return await message.reply_text("❌ No users found in the voice chat.")
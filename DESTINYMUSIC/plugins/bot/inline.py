@@ -1,3 +1,5 @@
+import asyncio
+
 from pyrogram.types import (
     InlineKeyboardButton,
     InlineKeyboardMarkup,
@@ -5,44 +7,43 @@ from pyrogram.types import (
 )
 from youtubesearchpython.__future__ import VideosSearch
 
+from DESTINYMUSIC.utils.cache import TTLCache
 from DESTINYMUSIC.utils.inlinequery import answer
 from config import BANNED_USERS
 from DESTINYMUSIC import app
 
+INLINE_RESULTS = 15
+INLINE_DEBOUNCE = 0.6
+INLINE_CACHE_TIME = 300
+PREFIX_MIN_LEN = 3
+PREFIX_MIN_HITS = 5
 
-@app.on_inline_query(~BANNED_USERS)
-async def inline_query_handler(client, query):
-    text = query.query.strip().lower()
-    answers = []
-    if text.strip() == "":
-        try:
-            await client.answer_inline_query(query.id, results=answer, cache_time=10)
-        except:
-            return
-    else:
-        a = VideosSearch(text, limit=20)
-        result = (await a.next()).get("result")
-        for x in range(15):
-            title = (result[x]["title"]).title()
-            duration = result[x]["duration"]
-            views = result[x]["viewCount"]["short"]
-            thumbnail = result[x]["thumbnails"][0]["url"].split("?")[0]
-            channellink = result[x]["channel"]["link"]
-            channel = result[x]["channel"]["name"]
-            link = result[x]["link"]
-            published = result[x]["publishedTime"]
-            description = f"{views} | {duration} ᴍɪɴᴜᴛᴇs | {channel}  | {published}"
-            buttons = InlineKeyboardMarkup(
-                [
-                    [
-                        InlineKeyboardButton(
-                            text="ʏᴏᴜᴛᴜʙᴇ 🎄",
-                            url=link,
-                        )
-                    ],
-                ]
-            )
-            searched_text = f"""
+# Built results per query text as (match text, result) pairs, and the latest query per user
+searches = TTLCache(10 * 60, maxsize=1024)
+latest = {}
+
+
+def _build(x) -> InlineQueryResultPhoto:
+    title = (x.get("title") or "").title()
+    duration = x.get("duration")
+    views = (x.get("viewCount") or {}).get("short")
+    thumbnail = (x.get("thumbnails") or [{}])[0].get("url", "").split("?")[0]
+    channellink = (x.get("channel") or {}).get("link")
+    channel = (x.get("channel") or {}).get("name")
+    link = x.get("link")
+    published = x.get("publishedTime")
+    description = f"{views} | {duration} ᴍɪɴᴜᴛᴇs | {channel}  | {published}"
+    buttons = InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton(
+                    text="ʏᴏᴜᴛᴜʙᴇ 🎄",
+                    url=link,
+                )
+            ],
+        ]
+    )
+    searched_text = f"""
 ❄ <b>ᴛɪᴛʟᴇ :</b> <a href={link}>{title}</a>
 
 ⏳ <b>ᴅᴜʀᴀᴛɪᴏɴ :</b> {duration} ᴍɪɴᴜᴛᴇs
@@ -52,17 +53,65 @@ async def inline_query_handler(client, query):
 
 
 <u><b>➻ ɪɴʟɪɴᴇ sᴇᴀʀᴄʜ ᴍᴏᴅᴇ ʙʏ {app.name}</b></u>"""
-            answers.append(
-                InlineQueryResultPhoto(
-                    photo_url=thumbnail,
-                    title=title,
-                    thumb_url=thumbnail,
-                    description=description,
-                    caption=searched_text,
-                    reply_markup=buttons,
-                )
-            )
+    return InlineQueryResultPhoto(
+        photo_url=thumbnail,
+        title=title,
+        thumb_url=thumbnail,
+        description=description,
+        caption=searched_text,
+        reply_markup=buttons,
+    )
+
+
+def _from_prefix(text: str):
+    words = text.split()
+    for end in range(len(text) - 1, PREFIX_MIN_LEN - 1, -1):
+        cached = searches.get(text[:end])
+        if cached is None:
+            continue
+        hits = [item for item in cached if all(w in item[0] for w in words)]
+        return hits if len(hits) >= PREFIX_MIN_HITS else None
+    return None
+
+
+async def _search(text: str):
+    result = (await VideosSearch(text, limit=20).next()).get("result") or []
+    return [
+        (f"{x.get('title', '')} {(x.get('channel') or {}).get('name', '')}".lower(), _build(x))
+        for x in result[:INLINE_RESULTS]
+        if x.get("link")
+    ]
+
+
+@app.on_inline_query(~BANNED_USERS)
+async def inline_query_handler(client, query):
+    text = query.query.strip().lower()
+    if text == "":
         try:
-            return await client.answer_inline_query(query.id, results=answers)
+            await client.answer_inline_query(query.id, results=answer, cache_time=10)
         except:
             return
+        return
+    found = searches.get(text)
+    if found is None:
+        found = _from_prefix(text)
+    if found is None:
+        user_id = query.from_user.id
+        latest[user_id] = text
+        await asyncio.sleep(INLINE_DEBOUNCE)
+        if latest.get(user_id) != text:
+            return
+        latest.pop(user_id, None)
+        try:
+            found = await _search(text)
+        except Exception:
+            return
+    searches[text] = found
+    try:
+        return await client.answer_inline_query(
+            query.id,
+            results=[item[1] for item in found],
+            cache_time=INLINE_CACHE_TIME,
+        )
+    except:
+        return
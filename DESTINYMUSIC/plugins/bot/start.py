@@ -25,6 +25,7 @@ from DESTINYMUSIC.utils.decorators.language import LanguageStart
 from DESTINYMUSIC.utils.formatters import get_readable_time
 from DESTINYMUSIC.utils.inline.start import private_panel, start_panel
 from DESTINYMUSIC.utils.inline.help import first_page
+from DESTINYMUSIC.utils.warmup import schedule_warmup
 from config import BANNED_USERS, AYUV, HELP_IMG_URL, START_VIDS, STICKERS
 from strings import get_string
 
@@ -119,6 +120,7 @@ async def start_gp(client, message: Message, _):
         caption=_["start_1"].format(app.mention, get_readable_time(uptime)),
         reply_markup=InlineKeyboardMarkup(out),
     )
+    schedule_warmup(message.chat.id)
     return await add_served_chat(message.chat.id)
 
 @app.on_message(filters.new_chat_members, group=-1)
@@ -159,6 +161,7 @@ async def welcome(client, message: Message):
                     reply_markup=InlineKeyboardMarkup(out),
                 )
                 await add_served_chat(message.chat.id)
+                schedule_warmup(message.chat.id)
                 await message.stop_propagation()
         except Exception as ex:
             print(ex)
@@ -1,74 +1,57 @@
 import asyncio
-from datetime import datetime
+import time
 
 from pyrogram.enums import ChatType
 
 import config
-from DESTINYMUSIC import app
-from DESTINYMUSIC.core.call import JARVIS, autoend
-from DESTINYMUSIC.utils.database import get_client, is_active_chat, is_autoend
+from DESTINYMUSIC.utils import activity
+from DESTINYMUSIC.utils.database import get_client, is_active_chat
+
+KEEP_CHATS = (config.LOGGER_ID, -1002077986660, -1002166290494)
+
+
+async def index_dialogs(client) -> None:
+    dialogs = {}
+    async for i in client.get_dialogs():
+        if i.chat.type in [
+            ChatType.SUPERGROUP,
+            ChatType.GROUP,
+            ChatType.CHANNEL,
+        ]:
+            top = i.top_message
+            dialogs[i.chat.id] = top.date.timestamp() if top and top.date else time.time()
+    activity.seed(client.id, dialogs)
 
 
 async def auto_leave():
     if config.AUTO_LEAVING_ASSISTANT:
-        while not await asyncio.sleep(900):
-            from DESTINYMUSIC.core.userbot import assistants
+        from DESTINYMUSIC.core.userbot import assistants
+
+        await asyncio.sleep(60)
+        for num in assistants:
+            try:
+                await index_dialogs(await get_client(num))
+            except:
+                pass
 
+        while not await asyncio.sleep(900):
             for num in assistants:
                 client = await get_client(num)
                 left = 0
-                try:
-                    async for i in client.get_dialogs():
-                        if i.chat.type in [
-                            ChatType.SUPERGROUP,
-                            ChatType.GROUP,
-                            ChatType.CHANNEL,
-                        ]:
-                            if (
-                                i.chat.id != config.LOGGER_ID
-                                and i.chat.id != -1002077986660
-                                and i.chat.id != -1002166290494
-                            ):
-                                if left == 20:
-                                    continue
-                                if not await is_active_chat(i.chat.id):
-                                    try:
-                                        await client.leave_chat(i.chat.id)
-                                        left += 1
-                                    except:
-                                        continue
-                except:
-                    pass
+                for chat_id in activity.oldest_idle(
+                    client.id, config.AUTO_LEAVE_ASSISTANT_TIME, config.AUTO_LEAVE_RATE * 2
+                ):
+                    if left == config.AUTO_LEAVE_RATE:
+                        break
+                    if chat_id in KEEP_CHATS or await is_active_chat(chat_id):
+                        activity.touch(client.id, chat_id)
+                        continue
+                    try:
+                        await client.leave_chat(chat_id)
+                        left += 1
+                    except:
+                        pass
+                    activity.forget(client.id, chat_id)
 
 
 asyncio.create_task(auto_leave())
-
-
-async def auto_end():
-    while not await asyncio.sleep(5):
-        ender = await is_autoend()
-        if not ender:
-            continue
-        for chat_id in autoend:
-            timer = autoend.get(chat_id)
-            if not timer:
-                continue
-            if datetime.now() > timer:
-                if not await is_active_chat(chat_id):
-                    autoend[chat_id] = {}
-                    continue
-                autoend[chat_id] = {}
-                try:
-                    await JARVIS.stop_stream(chat_id)
-                except:
-                    continue
-                try:
-                    await app.send_message(
-                        chat_id,
-                        "» ʙᴏᴛ ᴀᴜᴛᴏᴍᴀᴛɪᴄᴀʟʟʏ ʟᴇғᴛ ᴠɪᴅᴇᴏᴄʜᴀᴛ ʙᴇᴄᴀᴜsᴇ ɴᴏ ᴏɴᴇ ᴡᴀs ʟɪsᴛᴇɴɪɴɢ ᴏɴ ᴠɪᴅᴇᴏᴄʜᴀᴛ.",
-                    )
-                except:
-                    continue
-
-
-asyncio.create_task(auto_end())
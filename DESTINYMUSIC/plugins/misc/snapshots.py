@@ -0,0 +1,30 @@
+import asyncio
+
+from DESTINYMUSIC import LOGGER
+from DESTINYMUSIC.core.peers import persist_peers
+from DESTINYMUSIC.utils.stream.snapshot import save_snapshots
+
+SNAPSHOT_INTERVAL = 60
+PEERS_INTERVAL = 5 * 60
+
+
+async def snapshot_queues():
+    while not await asyncio.sleep(SNAPSHOT_INTERVAL):
+        try:
+            await save_snapshots()
+        except Exception as e:
+            LOGGER(__name__).warning(f"Queue snapshot failed: {e}")
+
+
+asyncio.create_task(snapshot_queues())
+
+
+async def snapshot_peers():
+    while not await asyncio.sleep(PEERS_INTERVAL):
+        try:
+            await persist_peers()
+        except Exception as e:
+            LOGGER(__name__).warning(f"Peer snapshot failed: {e}")
+
+
+asyncio.create_task(snapshot_peers())
@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+from DESTINYMUSIC import LOGGER
+from DESTINYMUSIC.core.call import JARVIS
+from DESTINYMUSIC.misc import db
+from DESTINYMUSIC.utils import metrics
+from DESTINYMUSIC.utils.database import get_active_chats, group_assistant, is_music_playing
+
+CHECK_INTERVAL = 5
+STALL_AFTER = 20
+
+progress = {}
+
+
+async def _sample(chat_id: int):
+    try:
+        assistant = await group_assistant(JARVIS, chat_id)
+        return await assistant.time(chat_id)
+    except Exception:
+        return None
+
+
+async def stream_watchdog():
+    while not await asyncio.sleep(CHECK_INTERVAL):
+        now = time.monotonic()
+        active = await get_active_chats()
+        for chat_id in list(progress):
+            if chat_id not in active:
+                progress.pop(chat_id, None)
+        for chat_id in active:
+            playing = db.get(chat_id)
+            if not playing or not await is_music_playing(chat_id):
+                progress.pop(chat_id, None)
+                continue
+            entry = playing[0]
+            position = await _sample(chat_id)
+            state = progress.get(chat_id)
+            # An unreadable position (None) that stays unreadable counts as no progress.
+            if not state or state["entry"] is not entry or position != state["position"]:
+                progress[chat_id] = {
+                    "entry": entry,
+                    "position": position,
+                    "played": entry["played"],
+                    "at": now,
+                }
+                continue
+            if now - state["at"] < STALL_AFTER:
+                continue
+
+            progress.pop(chat_id, None)
+            metrics.inc("stream_stalls_total", streamtype=entry["streamtype"])
+            LOGGER(__name__).warning(f"Stream stalled in {chat_id} at {state['played']}s")
+            try:
+                seconds = int(entry["seconds"] or 0)
+                if seconds and state["played"] >= seconds - 5:
+                    await JARVIS.play(await group_assistant(JARVIS, chat_id), chat_id)
+                else:
+                    await JARVIS.recover_stream(chat_id, state["played"])
+            except Exception as e:
+                LOGGER(__name__).info(f"Stream recovery error in {chat_id}: {e}")
+
+
+asyncio.create_task(stream_watchdog())
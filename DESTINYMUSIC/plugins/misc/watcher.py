@@ -1,14 +1,38 @@
 from pyrogram import filters
-from pyrogram.types import Message
+from pyrogram.enums import ChatMemberStatus
+from pyrogram.types import ChatMemberUpdated, Message
 
 from DESTINYMUSIC import app
 from DESTINYMUSIC.core.call import JARVIS
+from DESTINYMUSIC.core.userbot import assistantids
+from DESTINYMUSIC.utils import activity
+from DESTINYMUSIC.utils.warmup import forget_warm, links
 
 welcome = 20
 close = 30
+members = 40
 
 
 @app.on_message(filters.video_chat_started, group=welcome)
 @app.on_message(filters.video_chat_ended, group=close)
 async def welcome(_, message: Message):
     await JARVIS.force_stop_stream(message.chat.id)
+
+
+@app.on_chat_member_updated(group=members)
+async def assistant_membership(_, update: ChatMemberUpdated):
+    member = update.new_chat_member or update.old_chat_member
+    if not member or not member.user:
+        return
+    if member.user.id in assistantids:
+        forget_warm(update.chat.id, member.user.id)
+        if update.new_chat_member and update.new_chat_member.status not in (
+            ChatMemberStatus.LEFT,
+            ChatMemberStatus.BANNED,
+        ):
+            activity.touch(member.user.id, update.chat.id)
+        else:
+            activity.forget(member.user.id, update.chat.id)
+    elif member.user.id == app.id:
+        forget_warm(update.chat.id)
+        links.pop(update.chat.id)
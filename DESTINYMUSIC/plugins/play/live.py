@@ -5,6 +5,7 @@ from DESTINYMUSIC.utils.channelplay import get_channeplayCB
 from DESTINYMUSIC.utils.decorators.language import languageCB
 from DESTINYMUSIC.utils.stream.stream import stream
 from DESTINYMUSIC.utils.errors import capture_callback_err
+from DESTINYMUSIC.utils.handoff import recall
 from config import BANNED_USERS, AYU
 
 @app.on_callback_query(filters.regex("LiveStream") & ~BANNED_USERS)
@@ -33,10 +34,12 @@ async def play_live_stream(client, CallbackQuery, _):
     mystic = await CallbackQuery.message.reply_text(
         _["play_2"].format(channel) if channel else random.choice(AYU)
     )
-    try:
-        details, track_id = await YouTube.track(vidid, True)
-    except:
-        return await mystic.edit_text(_["play_3"])
+    details = recall(vidid, user_id)
+    if not details:
+        try:
+            details, track_id = await YouTube.track(vidid, True)
+        except:
+            return await mystic.edit_text(_["play_3"])
     ffplay = True if fplay == "f" else None
     if not details["duration_min"]:
         try:
@@ -17,6 +17,7 @@ from DESTINYMUSIC.utils.decorators.language import languageCB
 from DESTINYMUSIC.utils.decorators.play import PlayWrapper
 from DESTINYMUSIC.utils.errors import capture_err, capture_callback_err
 from DESTINYMUSIC.utils.formatters import formats
+from DESTINYMUSIC.utils.handoff import recall, remember
 from DESTINYMUSIC.utils.inline import (
     botplaylist_markup,
     livestream_markup,
@@ -25,6 +26,7 @@ from DESTINYMUSIC.utils.inline import (
     track_markup,
 )
 from DESTINYMUSIC.utils.logger import play_logs
+from DESTINYMUSIC.utils.metrics import PlayTrace
 from DESTINYMUSIC.utils.stream.stream import stream
 
 
@@ -36,7 +38,8 @@ from DESTINYMUSIC.utils.stream.stream import stream
 )
 @PlayWrapper
 @capture_err
-async def play_command(client, message: Message, _, chat_id, video, channel, playmode, url, fplay):
+async def play_command(client, message: Message, _, chat_id, video, channel, playmode, url, fplay, trace=None):
+    trace = trace or PlayTrace(chat_id)
     try:
         mystic = await message.reply_text(
             _["play_2"].format(channel) if channel else random.choice(AYU)
@@ -52,6 +55,7 @@ async def play_command(client, message: Message, _, chat_id, video, channel, pla
             _["play_2"].format(channel) if channel else random.choice(AYU)
         )
 
+    trace.mark("reply")
     plist_id, plist_type, spotify, slider = None, None, None, None
     user_id = message.from_user.id
     user_name = message.from_user.first_name
@@ -72,7 +76,10 @@ async def play_command(client, message: Message, _, chat_id, video, channel, pla
             )
 
         file_path = await Telegram.get_filepath(audio=audio_telegram)
-        downloaded = await Telegram.download(_, message, mystic, file_path)
+        downloaded = await Telegram.stream(
+            _, message, mystic, file_path, audio_telegram.file_size
+        )
+        trace.mark("download")
         if downloaded:
             message_link = await Telegram.get_link(message)
             file_name = await Telegram.get_filename(audio_telegram, audio=True)
@@ -96,11 +103,13 @@ async def play_command(client, message: Message, _, chat_id, video, channel, pla
                     message.chat.id,
                     streamtype="telegram",
                     forceplay=fplay,
+                    trace=trace,
                 )
             except Exception as e:
                 err = e if type(e).__name__ == "AssistantErr" else _["general_2"].format(type(e).__name__)
                 return await mystic.edit_text(err)
 
+            trace.finish("telegram")
             return await mystic.delete()
         return
 
@@ -126,7 +135,10 @@ async def play_command(client, message: Message, _, chat_id, video, channel, pla
             return await mystic.edit_text(_["play_8"])
 
         file_path = await Telegram.get_filepath(video=video_telegram)
-        downloaded = await Telegram.download(_, message, mystic, file_path)
+        downloaded = await Telegram.stream(
+            _, message, mystic, file_path, video_telegram.file_size
+        )
+        trace.mark("download")
         if downloaded:
             message_link = await Telegram.get_link(message)
             file_name = await Telegram.get_filename(video_telegram)
@@ -151,11 +163,13 @@ async def play_command(client, message: Message, _, chat_id, video, channel, pla
                     video=True,
                     streamtype="telegram",
                     forceplay=fplay,
+                    trace=trace,
                 )
             except Exception as e:
                 err = e if type(e).__name__ == "AssistantErr" else _["general_2"].format(type(e).__name__)
                 return await mystic.edit_text(err)
 
+            trace.finish("telegram")
             return await mystic.delete()
         return
 
@@ -278,6 +292,7 @@ async def play_command(client, message: Message, _, chat_id, video, channel, pla
             except:
                 return await mystic.edit_text(_["play_3"])
 
+            trace.mark("download")
             if details["duration_sec"] > config.DURATION_LIMIT:
                 return await mystic.edit_text(
                     _["play_6"].format(config.DURATION_LIMIT_MIN, app.mention)
@@ -294,11 +309,13 @@ async def play_command(client, message: Message, _, chat_id, video, channel, pla
                     message.chat.id,
                     streamtype="soundcloud",
                     forceplay=fplay,
+                    trace=trace,
                 )
             except Exception as e:
                 err = e if type(e).__name__ == "AssistantErr" else _["general_2"].format(type(e).__name__)
                 return await mystic.edit_text(err)
 
+            trace.finish("soundcloud")
             return await mystic.delete()
 
         else:
@@ -313,6 +330,7 @@ async def play_command(client, message: Message, _, chat_id, video, channel, pla
             except Exception as e:
                 return await mystic.edit_text(_["general_2"].format(type(e).__name__))
 
+            trace.mark("probe")
             await mystic.edit_text(_["str_2"])
             try:
                 await stream(
@@ -326,11 +344,13 @@ async def play_command(client, message: Message, _, chat_id, video, channel, pla
                     video=video,
                     streamtype="index",
                     forceplay=fplay,
+                    trace=trace,
                 )
             except Exception as e:
                 err = e if type(e).__name__ == "AssistantErr" else _["general_2"].format(type(e).__name__)
                 return await mystic.edit_text(err)
 
+            trace.finish("index")
             return await play_logs(message, streamtype="M3U8 or Index Link")
 
     else:
@@ -353,6 +373,7 @@ async def play_command(client, message: Message, _, chat_id, video, channel, pla
 
         streamtype = "youtube"
 
+    trace.mark("search")
     if str(playmode) == "Direct":
         if not plist_type:
             if details.get("duration_min"):
@@ -362,6 +383,7 @@ async def play_command(client, message: Message, _, chat_id, video, channel, pla
                         _["play_6"].format(config.DURATION_LIMIT_MIN, app.mention)
                     )
             else:
+                remember(track_id, user_id, details)
                 buttons = livestream_markup(
                     _,
                     track_id,
@@ -388,11 +410,13 @@ async def play_command(client, message: Message, _, chat_id, video, channel, pla
                 streamtype=streamtype,
                 spotify=spotify,
                 forceplay=fplay,
+                trace=trace,
             )
         except Exception as e:
             err = e if type(e).__name__ == "AssistantErr" else _["general_2"].format(type(e).__name__)
             return await mystic.edit_text(err)
 
+        trace.finish(streamtype)
         await mystic.delete()
         return await play_logs(message, streamtype=streamtype)
 
@@ -417,6 +441,7 @@ async def play_command(client, message: Message, _, chat_id, video, channel, pla
             return await play_logs(message, streamtype=f"Playlist : {plist_type}")
 
         else:
+            remember(track_id, user_id, details)
             if slider:
                 buttons = slider_markup(
                     _,
@@ -489,7 +514,11 @@ async def play_music(client, CallbackQuery, _):
                 _["play_2"].format(channel) if channel else random.choice(AYU)
             )
 
-        details, track_id = await YouTube.track(vidid, videoid=vidid)
+        details = recall(vidid, user_id)
+        if details:
+            track_id = vidid
+        else:
+            details, track_id = await YouTube.track(vidid, videoid=vidid)
 
         if details.get("duration_min"):
             duration_sec = time_to_seconds(details["duration_min"])
@@ -498,6 +527,7 @@ async def play_music(client, CallbackQuery, _):
                     _["play_6"].format(config.DURATION_LIMIT_MIN, app.mention)
                 )
         else:
+            remember(track_id, user_id, details)
             buttons = livestream_markup(
                 _,
                 track_id,
@@ -639,6 +669,17 @@ async def slider_queries(client, CallbackQuery, _):
             query_type = 9
 
         title, duration_min, thumbnail, vidid = await YouTube.slider(query, query_type)
+        remember(
+            vidid,
+            user_id,
+            {
+                "title": title,
+                "link": f"https://www.youtube.com/watch?v={vidid}",
+                "vidid": vidid,
+                "duration_min": duration_min,
+                "thumb": thumbnail,
+            },
+        )
 
         buttons = slider_markup(_, vidid, user_id, query, query_type, cplay, fplay)
         med = InputMediaPhoto(
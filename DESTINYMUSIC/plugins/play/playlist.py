@@ -0,0 +1,227 @@
+import asyncio
+import random
+import re
+import time
+
+from pyrogram import filters
+from pyrogram.types import Message
+
+import config
+from config import AYU, BANNED_USERS, adminlist
+from DESTINYMUSIC import Spotify, YouTube, app
+from DESTINYMUSIC.misc import SUDOERS, db
+from DESTINYMUSIC.utils.database import (
+    delete_playlist,
+    get_playlist,
+    get_playlist_names,
+    is_active_chat,
+    save_playlist,
+)
+from DESTINYMUSIC.utils.decorators.language import language
+from DESTINYMUSIC.utils.decorators.play import PlayWrapper
+from DESTINYMUSIC.utils.errors import capture_err
+from DESTINYMUSIC.utils.formatters import time_to_seconds
+from DESTINYMUSIC.utils.metrics import PlayTrace
+from DESTINYMUSIC.utils.stream.queue import put_queue_tracks
+from DESTINYMUSIC.utils.stream.stream import stream
+
+RESOLVE_CONCURRENCY = 5
+REVALIDATE_AFTER = 7 * 24 * 60 * 60
+NAME = re.compile(r"^[\w-]{1,32}$")
+
+revalidating = set()
+
+
+def _parse(message: Message):
+    args = message.command[1:]
+    shared = "-c" in args
+    return shared, [arg for arg in args if arg != "-c"]
+
+
+def _can_share(message: Message) -> bool:
+    user_id = message.from_user.id
+    return user_id in SUDOERS or user_id in (adminlist.get(message.chat.id) or [])
+
+
+async def _details(ref: str, videoid: bool):
+    # Unavailable videos are routine here, so skip the error-reporting YouTube.details.
+    info = await YouTube._fetch_video_info(YouTube._prepare_link(ref, videoid))
+    if not info or not info.get("duration"):
+        return False
+    duration_min = info["duration"]
+    duration_sec = int(time_to_seconds(duration_min))
+    if duration_sec > config.DURATION_LIMIT:
+        return False
+    return {
+        "vidid": info.get("id", ""),
+        "title": info.get("title", "").title(),
+        "dur": duration_min,
+        "seconds": duration_sec,
+    }
+
+
+async def _resolve_all(refs: list, videoid: bool, fallback: list = None) -> list:
+    slots = asyncio.Semaphore(RESOLVE_CONCURRENCY)
+
+    async def one(index, ref):
+        async with slots:
+            try:
+                return await _details(ref, videoid)
+            except Exception:
+                return fallback[index] if fallback else False
+
+    return [track for track in await asyncio.gather(*(one(i, r) for i, r in enumerate(refs))) if track]
+
+
+async def _resolve_link(link: str, user_id: int):
+    if await YouTube.exists(link) and "playlist" in link:
+        refs = await YouTube.playlist(link, config.SERVER_PLAYLIST_LIMIT, user_id)
+        return await _resolve_all(refs, True)
+    if await Spotify.valid(link) and ("playlist" in link or "album" in link):
+        refs, _ = await (Spotify.playlist(link) if "playlist" in link else Spotify.album(link))
+        return await _resolve_all(refs[: config.SERVER_PLAYLIST_LIMIT], False)
+    return None
+
+
+def _from_queue(chat_id: int) -> list:
+    tracks = []
+    for entry in db.get(chat_id) or ():
+        if entry.lazy or entry.vidid in (None, "telegram", "soundcloud"):
+            continue
+        if "live_" in entry.file or "index_" in entry.file:
+            continue
+        tracks.append(
+            {
+                "vidid": entry.vidid,
+                "title": entry.title,
+                "dur": entry.old_dur or entry.dur,
+                "seconds": int(entry.old_second or entry.seconds or 0) + 3,
+            }
+        )
+    return tracks[: config.SERVER_PLAYLIST_LIMIT]
+
+
+async def _revalidate(owner_id: int, name: str, note: dict) -> None:
+    key = (owner_id, name)
+    if key in revalidating:
+        return
+    revalidating.add(key)
+    try:
+        tracks = note["tracks"]
+        fresh = await _resolve_all([track["vidid"] for track in tracks], True, tracks)
+        await save_playlist(owner_id, name, {"tracks": fresh, "checked": time.time()})
+    finally:
+        revalidating.discard(key)
+
+
+@app.on_message(filters.command(["saveplaylist"]) & filters.group & ~BANNED_USERS)
+@language
+async def save_playlist_command(client, message: Message, _):
+    shared, args = _parse(message)
+    if not args or not NAME.match(args[0]):
+        return await message.reply_text(
+            "<b>ᴇxᴀᴍᴘʟᴇ :</b>\n\n/saveplaylist [ɴᴀᴍᴇ] - sᴀᴠᴇ ᴛʜᴇ ᴄᴜʀʀᴇɴᴛ ǫᴜᴇᴜᴇ\n"
+            "/saveplaylist [ɴᴀᴍᴇ] [ᴘʟᴀʏʟɪsᴛ ʟɪɴᴋ]\n\nᴀᴅᴅ -c ᴛᴏ sᴀᴠᴇ ɪᴛ ғᴏʀ ᴛʜᴇ ᴡʜᴏʟᴇ ᴄʜᴀᴛ."
+        )
+    if shared and not _can_share(message):
+        return await message.reply_text(_["admin_14"])
+    name = args[0].lower()
+    owner_id = message.chat.id if shared else message.from_user.id
+    if len(args) > 1:
+        mystic = await message.reply_text("» ʀᴇsᴏʟᴠɪɴɢ ᴘʟᴀʏʟɪsᴛ, ᴘʟᴇᴀsᴇ ᴡᴀɪᴛ...")
+        try:
+            tracks = await _resolve_link(args[1], message.from_user.id)
+        except Exception:
+            tracks = None
+        if tracks is None:
+            return await mystic.edit_text(_["play_3"])
+    else:
+        mystic = None
+        tracks = _from_queue(message.chat.id)
+    if not tracks:
+        text = "» ɴᴏᴛʜɪɴɢ ᴛᴏ sᴀᴠᴇ."
+        return await (mystic.edit_text(text) if mystic else message.reply_text(text))
+    await save_playlist(owner_id, name, {"tracks": tracks, "checked": time.time()})
+    text = f"» sᴀᴠᴇᴅ <b>{name}</b> ᴡɪᴛʜ {len(tracks)} ᴛʀᴀᴄᴋs, ᴘʟᴀʏ ɪᴛ ᴡɪᴛʜ /playlist {name}"
+    return await (mystic.edit_text(text) if mystic else message.reply_text(text))
+
+
+@app.on_message(filters.command(["playlists", "delplaylist"]) & filters.group & ~BANNED_USERS)
+@language
+async def list_playlists_command(client, message: Message, _):
+    shared, args = _parse(message)
+    if message.command[0] == "delplaylist":
+        if not args:
+            return await message.reply_text("<b>ᴇxᴀᴍᴘʟᴇ :</b>\n\n/delplaylist [-c] [ɴᴀᴍᴇ]")
+        if shared and not _can_share(message):
+            return await message.reply_text(_["admin_14"])
+        owner_id = message.chat.id if shared else message.from_user.id
+        if not await delete_playlist(owner_id, args[0].lower()):
+            return await message.reply_text("» ɴᴏ sᴜᴄʜ ᴘʟᴀʏʟɪsᴛ.")
+        return await message.reply_text(f"» ᴅᴇʟᴇᴛᴇᴅ <b>{args[0].lower()}</b>.")
+    mine = await get_playlist_names(message.from_user.id)
+    chat = await get_playlist_names(message.chat.id)
+    return await message.reply_text(
+        f"<b>» ʏᴏᴜʀ ᴘʟᴀʏʟɪsᴛs :</b> {', '.join(mine) or 'ɴᴏɴᴇ'}\n"
+        f"<b>» ᴄʜᴀᴛ ᴘʟᴀʏʟɪsᴛs :</b> {', '.join(chat) or 'ɴᴏɴᴇ'}\n\n"
+        "ᴘʟᴀʏ ᴡɪᴛʜ /playlist [ɴᴀᴍᴇ], ᴀᴅᴅ -c ғᴏʀ ᴄʜᴀᴛ ᴘʟᴀʏʟɪsᴛs."
+    )
+
+
+@app.on_message(
+    filters.command(["playlist", "vplaylist", "cplaylist", "cvplaylist"])
+    & filters.group
+    & ~BANNED_USERS
+)
+@PlayWrapper
+@capture_err
+async def play_playlist_command(client, message: Message, _, chat_id, video, channel, playmode, url, fplay, trace=None):
+    trace = trace or PlayTrace(chat_id)
+    shared, args = _parse(message)
+    owner_id = message.chat.id if shared else message.from_user.id
+    name = args[0].lower() if args else ""
+    note = await get_playlist(owner_id, name)
+    if not note or not note["tracks"]:
+        return await message.reply_text("» ɴᴏ sᴀᴠᴇᴅ ᴘʟᴀʏʟɪsᴛ ᴡɪᴛʜ ᴛʜᴀᴛ ɴᴀᴍᴇ, sᴇᴇ /playlists")
+    mystic = await message.reply_text(
+        _["play_2"].format(channel) if channel else random.choice(AYU)
+    )
+    user_id = message.from_user.id
+    user_name = message.from_user.first_name
+    tracks = list(note["tracks"])
+    try:
+        if fplay or not await is_active_chat(chat_id):
+            first = tracks.pop(0)
+            details = {
+                "link": f"https://www.youtube.com/watch?v={first['vidid']}",
+                "vidid": first["vidid"],
+                "title": first["title"],
+                "duration_min": first["dur"],
+                "thumb": f"https://i.ytimg.com/vi/{first['vidid']}/hqdefault.jpg",
+            }
+            await stream(
+                _,
+                mystic,
+                user_id,
+                details,
+                chat_id,
+                user_name,
+                message.chat.id,
+                video=video,
+                streamtype="youtube",
+                forceplay=fplay,
+                trace=trace,
+            )
+        if tracks:
+            await put_queue_tracks(
+                chat_id, message.chat.id, tracks, user_name, user_id, "video" if video else "audio"
+            )
+    except Exception as e:
+        err = e if type(e).__name__ == "AssistantErr" else _["general_2"].format(type(e).__name__)
+        return await mystic.edit_text(err)
+    if time.time() - note.get("checked", 0) > REVALIDATE_AFTER:
+        asyncio.create_task(_revalidate(owner_id, name, note))
+    trace.finish("saved")
+    await mystic.edit_text(
+        f"» ǫᴜᴇᴜᴇᴅ {len(note['tracks'])} ᴛʀᴀᴄᴋs ғʀᴏᴍ <b>{name}</b>, ʀᴇǫᴜᴇsᴛᴇᴅ ʙʏ {message.from_user.mention}"
+    )
@@ -0,0 +1,77 @@
+from pyrogram import filters
+from pyrogram.types import Message
+from pytgcalls.exceptions import NoActiveGroupCall
+
+from DESTINYMUSIC import app
+from DESTINYMUSIC.core.call import JARVIS
+from DESTINYMUSIC.core.station import Station, listening, stations
+from DESTINYMUSIC.misc import SUDOERS
+from DESTINYMUSIC.utils.database import add_active_chat, group_assistant, is_active_chat, music_on
+from DESTINYMUSIC.utils.decorators import AdminActual
+from config import BANNED_USERS
+
+
+def _describe(station: Station) -> str:
+    stats = station.stats()
+    line = f"<b>{station.name}</b> · {stats['listeners']} ʟɪsᴛᴇɴᴇʀs"
+    if station.running:
+        line += (
+            f"\n  ├ ғғᴍᴘᴇɢ : {stats['ffmpeg_cpu']:.1f}% ᴄᴘᴜ "
+            f"({stats['cpu_per_listener']:.2f}% ᴘᴇʀ ʟɪsᴛᴇɴᴇʀ)"
+        )
+        if stats["fanout"]:
+            line += f"\n  └ ғᴀɴ-ᴏᴜᴛ : p95 {stats['fanout']['p95'] * 1000:.2f}ms ᴘᴇʀ ғʀᴀᴍᴇ"
+    return line
+
+
+@app.on_message(filters.command(["station", "stations"]) & SUDOERS)
+async def manage_station(_, message: Message):
+    usage = "<b>ᴇxᴀᴍᴘʟᴇ :</b>\n\n/station add [ɴᴀᴍᴇ] [ᴜʀʟ]\n/station del [ɴᴀᴍᴇ]"
+    if len(message.command) == 1:
+        if not stations:
+            return await message.reply_text(f"» ɴᴏ sᴛᴀᴛɪᴏɴs ʏᴇᴛ.\n\n{usage}")
+        return await message.reply_text(
+            "<b>» sᴛᴀᴛɪᴏɴs :</b>\n\n" + "\n\n".join(_describe(s) for s in stations.values())
+        )
+    action = message.command[1].lower()
+    if action == "add" and len(message.command) == 4:
+        name, source = message.command[2].lower(), message.command[3]
+        if name in stations:
+            return await message.reply_text("» sᴛᴀᴛɪᴏɴ ᴀʟʀᴇᴀᴅʏ ᴇxɪsᴛs.")
+        stations[name] = Station(name, source)
+        return await message.reply_text(f"» sᴛᴀᴛɪᴏɴ <b>{name}</b> ᴀᴅᴅᴇᴅ, ᴊᴏɪɴ ᴡɪᴛʜ /radio {name}")
+    if action == "del" and len(message.command) == 3:
+        station = stations.pop(message.command[2].lower(), None)
+        if not station:
+            return await message.reply_text("» ɴᴏ sᴜᴄʜ sᴛᴀᴛɪᴏɴ.")
+        for chat_id in list(station.listeners):
+            await JARVIS.stop_stream(chat_id)
+        await station.stop()
+        return await message.reply_text(f"» sᴛᴀᴛɪᴏɴ <b>{station.name}</b> ʀᴇᴍᴏᴠᴇᴅ.")
+    await message.reply_text(usage)
+
+
+@app.on_message(filters.command(["radio"]) & filters.group & ~BANNED_USERS)
+@AdminActual
+async def join_station(client, message: Message, _):
+    chat_id = message.chat.id
+    if len(message.command) != 2:
+        names = ", ".join(stations) or "ɴᴏɴᴇ"
+        return await message.reply_text(f"<b>ᴇxᴀᴍᴘʟᴇ :</b>\n\n/radio [sᴛᴀᴛɪᴏɴ]\n\nsᴛᴀᴛɪᴏɴs : {names}")
+    station = stations.get(message.command[1].lower())
+    if not station:
+        return await message.reply_text("» ɴᴏ sᴜᴄʜ sᴛᴀᴛɪᴏɴ.")
+    if await is_active_chat(chat_id) and chat_id not in listening:
+        return await message.reply_text("» ᴀ sᴛʀᴇᴀᴍ ɪs ᴀʟʀᴇᴀᴅʏ ᴘʟᴀʏɪɴɢ, /end ɪᴛ ғɪʀsᴛ.")
+    assistant = await group_assistant(JARVIS, chat_id)
+    try:
+        await station.subscribe(chat_id, assistant)
+    except NoActiveGroupCall:
+        return await message.reply_text(_["call_8"])
+    except Exception as e:
+        return await message.reply_text(f"ᴜɴᴀʙʟᴇ ᴛᴏ ᴊᴏɪɴ ᴛʜᴇ sᴛᴀᴛɪᴏɴ.\nRᴇᴀsᴏɴ: {e}")
+    await add_active_chat(chat_id)
+    await music_on(chat_id)
+    await message.reply_text(
+        f"» ᴛᴜɴᴇᴅ ɪɴ ᴛᴏ <b>{station.name}</b> ᴡɪᴛʜ {len(station.listeners)} ʟɪsᴛᴇɴɪɴɢ ᴄʜᴀᴛs."
+    )
@@ -2,6 +2,7 @@ from pyrogram import filters
 from pyrogram.types import Message
 
 from DESTINYMUSIC import app
+from DESTINYMUSIC.core.call import JARVIS, participants
 from DESTINYMUSIC.misc import SUDOERS
 from DESTINYMUSIC.utils.database import autoend_off, autoend_on
 
@@ -14,11 +15,15 @@ async def auto_end_stream(_, message: Message):
     state = message.text.split(None, 1)[1].strip().lower()
     if state == "enable":
         await autoend_on()
+        for chat_id in list(participants):
+            await JARVIS.check_idle(chat_id)
         await message.reply_text(
             "» ᴀᴜᴛᴏ ᴇɴᴅ sᴛʀᴇᴀᴍ ᴇɴᴀʙʟᴇᴅ.\n\nᴀssɪsᴛᴀɴᴛ ᴡɪʟʟ ᴀᴜᴛᴏᴍᴀᴛɪᴄᴀʟʟʏ ʟᴇᴀᴠᴇ ᴛʜᴇ ᴠɪᴅᴇᴏᴄʜᴀᴛ ᴀғᴛᴇʀ ғᴇᴡ ᴍɪɴs ᴡʜᴇɴ ɴᴏ ᴏɴᴇ ɪs ʟɪsᴛᴇɴɪɴɢ."
         )
     elif state == "disable":
         await autoend_off()
+        for chat_id in list(participants):
+            await JARVIS.check_idle(chat_id)
         await message.reply_text("» ᴀᴜᴛᴏ ᴇɴᴅ sᴛʀᴇᴀᴍ ᴅɪsᴀʙʟᴇᴅ.")
     else:
         await message.reply_text(usage)
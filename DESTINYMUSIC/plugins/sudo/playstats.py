@@ -0,0 +1,29 @@
+from pyrogram import filters
+from pyrogram.types import Message
+
+from DESTINYMUSIC import app
+from DESTINYMUSIC.misc import SUDOERS
+from DESTINYMUSIC.utils import metrics
+
+
+def _fmt(stats: dict) -> str:
+    return f"p50 {stats['p50']:.2f}s · p95 {stats['p95']:.2f}s · n={stats['count']}"
+
+
+@app.on_message(filters.command("playstats") & SUDOERS)
+async def play_stats(_, message: Message):
+    text = "<b>» /play ʟᴀᴛᴇɴᴄʏ</b>\n"
+    for labels, stats in sorted(metrics.summary("play_total_seconds").items()):
+        text += f"\n<b>{dict(labels).get('streamtype')}</b> : {_fmt(stats)}\n"
+        for phase_labels, phase in sorted(metrics.summary("play_phase_seconds").items()):
+            tags = dict(phase_labels)
+            if tags.get("streamtype") == dict(labels).get("streamtype"):
+                text += f"  ├ {tags.get('phase')} : {_fmt(phase)}\n"
+    for labels, stats in sorted(metrics.summary("transition_gap_seconds").items()):
+        text += f"\n<b>ᴛʀᴀɴsɪᴛɪᴏɴ ({dict(labels).get('preloaded')})</b> : {_fmt(stats)}"
+    if metrics.recent_traces:
+        text += "\n\n<b>ʀᴇᴄᴇɴᴛ :</b>\n"
+        text += "\n".join(f"<code>{trace}</code>" for trace in list(metrics.recent_traces)[-5:])
+    if text.count("\n") < 2:
+        text += "\nɴᴏ ᴅᴀᴛᴀ ʏᴇᴛ."
+    await message.reply_text(text)
@@ -12,6 +12,7 @@ from pyrogram import filters
 
 import config
 from DESTINYMUSIC import app
+from DESTINYMUSIC.core.peers import persist_peers
 from DESTINYMUSIC.misc import HAPP, SUDOERS, XCB
 from DESTINYMUSIC.utils.database import (
     get_active_chats,
@@ -20,14 +21,26 @@ from DESTINYMUSIC.utils.database import (
 )
 from DESTINYMUSIC.utils.decorators.language import language
 from DESTINYMUSIC.utils.pastebin import DESTINYBIN
+from DESTINYMUSIC.utils.stream.snapshot import resume_snapshots, save_snapshots
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 async def is_heroku():
     return "heroku" in socket.getfqdn()
 
-def cleanup_storage():
-    folders_to_remove = ["downloads", "raw_files", "cache"]
+async def snapshot_queues() -> int:
+    try:
+        await persist_peers()
+    except Exception as e:
+        print(f"[SNAPSHOT] Failed to save peers: {e}")
+    try:
+        return await save_snapshots(final=True)
+    except Exception as e:
+        print(f"[SNAPSHOT] Failed to save queues: {e}")
+        return 0
+
+def cleanup_storage(keep_downloads: bool = False):
+    folders_to_remove = ["raw_files", "cache"] if keep_downloads else ["downloads", "raw_files", "cache"]
     for folder in folders_to_remove:
         try:
             shutil.rmtree(folder)
@@ -111,6 +124,7 @@ async def update_(client, message, _):
 
     os.system("git stash &> /dev/null && git pull")
 
+    saved = await snapshot_queues()
     try:
         served_chats = await get_active_chats()
         for x in served_chats:
@@ -124,7 +138,7 @@ async def update_(client, message, _):
     except:
         pass
 
-    cleanup_storage()
+    cleanup_storage(keep_downloads=bool(saved))
 
     if await is_heroku():
         try:
@@ -133,34 +147,49 @@ async def update_(client, message, _):
             )
             return
         except Exception as err:
+            resume_snapshots()
             await response.edit(f"{nrs.text}\n\n{_['server_9']}")
             return await app.send_message(
                 chat_id=config.LOGGER_ID,
                 text=_["server_10"].format(err),
             )
     else:
-        os.execv(sys.executable, [sys.executable, "-m", "DESTINYMUSIC"])
+        try:
+            os.execv(sys.executable, [sys.executable, "-m", "DESTINYMUSIC"])
+        except OSError:
+            resume_snapshots()
+            raise
 
 
 @app.on_message(filters.command(["restart"]) & SUDOERS)
 async def restart_(_, message):
     response = await message.reply_text("ʀᴇsᴛᴀʀᴛɪɴɢ...")
+    saved = await snapshot_queues()
     ac_chats = await get_active_chats()
     for x in ac_chats:
         try:
             await app.send_message(
                 chat_id=int(x),
-                text=f"{app.mention} ɪs ʀᴇsᴛᴀʀᴛɪɴɢ...\n\nʏᴏᴜ ᴄᴀɴ sᴛᴀʀᴛ ᴩʟᴀʏɪɴɢ ᴀɢᴀɪɴ ᴀғᴛᴇʀ 15-20 sᴇᴄᴏɴᴅs.",
+                text=f"{app.mention} ɪs ʀᴇsᴛᴀʀᴛɪɴɢ...\n\n"
+                + (
+                    "ʏᴏᴜʀ ǫᴜᴇᴜᴇ ᴡɪʟʟ ʀᴇsᴜᴍᴇ ᴀᴜᴛᴏᴍᴀᴛɪᴄᴀʟʟʏ ɪɴ ᴀ ғᴇᴡ sᴇᴄᴏɴᴅs."
+                    if saved
+                    else "ʏᴏᴜ ᴄᴀɴ sᴛᴀʀᴛ ᴩʟᴀʏɪɴɢ ᴀɢᴀɪɴ ᴀғᴛᴇʀ 15-20 sᴇᴄᴏɴᴅs."
+                ),
             )
             await remove_active_chat(x)
             await remove_active_video_chat(x)
         except:
             pass
 
-    cleanup_storage()
+    cleanup_storage(keep_downloads=bool(saved))
 
     await response.edit_text(
         "» ʀᴇsᴛᴀʀᴛ ᴘʀᴏᴄᴇss sᴛᴀʀᴛᴇᴅ, ᴘʟᴇᴀsᴇ ᴡᴀɪᴛ ғᴏʀ ғᴇᴡ sᴇᴄᴏɴᴅs ᴜɴᴛɪʟ ᴛʜᴇ ʙᴏᴛ sᴛᴀʀᴛs..."
     )
 
-    os.execv(sys.executable, [sys.executable, "-m", "DESTINYMUSIC"])
\ No newline at end of file
+    try:
+        os.execv(sys.executable, [sys.executable, "-m", "DESTINYMUSIC"])
+    except OSError:
+        resume_snapshots()
+        raise
\ No newline at end of file
@@ -2,8 +2,10 @@ from pyrogram import filters, Client
 from pyrogram.types import Message, InlineKeyboardMarkup, InlineKeyboardButton
 from unidecode import unidecode
 
+import config
 from DESTINYMUSIC import app
 from DESTINYMUSIC.misc import SUDOERS
+from DESTINYMUSIC.utils.quality import admission
 from DESTINYMUSIC.utils.database import (
     get_active_chats,
     get_active_video_chats,
@@ -11,6 +13,14 @@ from DESTINYMUSIC.utils.database import (
     remove_active_video_chat,
 )
 
+def _video_budget() -> str:
+    decisions = list(admission.values())
+    limit = config.VIDEO_STREAM_LIMIT or "∞"
+    return (
+        f"ᴠɪᴅᴇᴏ ʙᴜᴅɢᴇᴛ : {decisions.count('hd') + decisions.count('sd')}/{limit} "
+        f"(sᴅ : {decisions.count('sd')}, ᴀᴜᴅɪᴏ ғᴀʟʟʙᴀᴄᴋ : {decisions.count('audio')})"
+    )
+
 @app.on_message(filters.command(["activevc", "activevoice", "vc"]) & SUDOERS)
 async def activevc(_, message: Message):
     mystic = await message.reply_text("» ɢᴇᴛᴛɪɴɢ ᴀᴄᴛɪᴠᴇ ᴠᴏɪᴄᴇ ᴄʜᴀᴛs ʟɪsᴛ...")
@@ -22,7 +32,8 @@ async def activevc(_, message: Message):
             chat = await app.get_chat(x)
             title = unidecode(chat.title).upper()
             link = f"<a href=https://t.me/{chat.username}>{title}</a>" if chat.username else title
-            text += f"<b>{j + 1}.</b> {link}\n"
+            mode = {"hd": " 🎥", "sd": " 🎥 sᴅ", "audio": " 🎧 ᴠɪᴅᴇᴏ ᴅᴇɴɪᴇᴅ"}.get(admission.get(x), "")
+            text += f"<b>{j + 1}.</b> {link}{mode}\n"
             j += 1
         except:
             await remove_active_chat(x)
@@ -30,7 +41,7 @@ async def activevc(_, message: Message):
         await mystic.edit_text(f"» ɴᴏ ᴀᴄᴛɪᴠᴇ ᴠᴏɪᴄᴇ ᴄʜᴀᴛs ᴏɴ {app.mention}.")
     else:
         await mystic.edit_text(
-            f"<b>» ʟɪsᴛ ᴏғ ᴄᴜʀʀᴇɴᴛʟʏ ᴀᴄᴛɪᴠᴇ ᴠᴏɪᴄᴇ ᴄʜᴀᴛs :</b>\n\n{text}",
+            f"<b>» ʟɪsᴛ ᴏғ ᴄᴜʀʀᴇɴᴛʟʏ ᴀᴄᴛɪᴠᴇ ᴠᴏɪᴄᴇ ᴄʜᴀᴛs :</b>\n\n{text}\n{_video_budget()}",
             disable_web_page_preview=True,
         )
 
@@ -45,7 +56,8 @@ async def activevi_(_, message: Message):
             chat = await app.get_chat(x)
             title = unidecode(chat.title).upper()
             link = f"<a href=https://t.me/{chat.username}>{title}</a>" if chat.username else title
-            text += f"<b>{j + 1}.</b> {link} [<code>{x}</code>]\n"
+            mode = "sᴅ" if admission.get(x) == "sd" else "ʜᴅ"
+            text += f"<b>{j + 1}.</b> {link} [<code>{x}</code>] {mode}\n"
             j += 1
         except:
             await remove_active_video_chat(x)
@@ -62,7 +74,7 @@ async def active_count(client: Client, message: Message):
     ac_audio = str(len(await get_active_chats()))
     ac_video = str(len(await get_active_video_chats()))
     await message.reply_text(
-        f"✫ <b><u>ᴀᴄᴛɪᴠᴇ ᴄʜᴀᴛs ɪɴғᴏ</u></b> :\n\nᴠᴏɪᴄᴇ : {ac_audio}\nᴠɪᴅᴇᴏ  : {ac_video}",
+        f"✫ <b><u>ᴀᴄᴛɪᴠᴇ ᴄʜᴀᴛs ɪɴғᴏ</u></b> :\n\nᴠᴏɪᴄᴇ : {ac_audio}\nᴠɪᴅᴇᴏ  : {ac_video}\n\n{_video_budget()}",
         reply_markup=InlineKeyboardMarkup(
             [[InlineKeyboardButton("✯ ᴄʟᴏsᴇ ✯", callback_data="close")]]
         )
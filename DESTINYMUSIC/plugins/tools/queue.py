@@ -1,20 +1,27 @@
 import asyncio
 import os
+from html import escape
+from itertools import islice
 
 from pyrogram import filters
-from pyrogram.errors import FloodWait
+from pyrogram.errors import FloodWait, MessageNotModified
 from pyrogram.types import CallbackQuery, InputMediaPhoto, Message
 
 import config
 from DESTINYMUSIC import app
 from DESTINYMUSIC.misc import db
-from DESTINYMUSIC.utils import DESTINYBIN, get_channeplayCB, seconds_to_min
+from DESTINYMUSIC.utils import get_channeplayCB, seconds_to_min
+from DESTINYMUSIC.utils.cache import TTLCache
 from DESTINYMUSIC.utils.database import get_cmode, is_active_chat, is_music_playing
 from DESTINYMUSIC.utils.decorators.language import language, languageCB
-from DESTINYMUSIC.utils.inline import queue_back_markup, queue_markup
+from DESTINYMUSIC.utils.inline import queue_markup, queue_page_markup
 from config import BANNED_USERS
 
+PAGE_SIZE = 10
+QUEUE_IMG = "https://telegra.ph//file/6f7d35131f69951c74ee5.jpg"
+
 basic = {}
+pages = TTLCache(10 * 60, maxsize=512)
 
 
 def get_image(videoid):
@@ -135,6 +142,32 @@ async def quite_timer(client, CallbackQuery: CallbackQuery):
         pass
 
 
+def _render(chat_id: int, got, page: int) -> str:
+    key = (chat_id, page)
+    cached = pages.get(key)
+    if cached and cached[0] is got and cached[1] == got.version:
+        return cached[2]
+    head = got[0]
+    msg = f"<b>Streaming :</b>\n{_clip(head['title'], 50)}\n{head['dur']} • {_clip(head['by'], 20)}\n\n"
+    msg += f"<b>Queued ({len(got) - 1}) :</b>\n"
+    first = page * PAGE_SIZE + 1
+    for i, x in enumerate(islice(got, first, first + PAGE_SIZE), first):
+        msg += f"{i}. {_clip(x['title'], 40)} [{x['dur']}] • {_clip(x['by'], 20)}\n"
+    pages.set(key, (got, got.version, msg))
+    return msg
+
+
+def _clip(text, limit: int) -> str:
+    text = str(text)
+    if len(text) > limit:
+        text = text[: limit - 1] + "…"
+    return escape(text)
+
+
+def _page_count(got) -> int:
+    return max(1, -(-(len(got) - 1) // PAGE_SIZE))
+
+
 @app.on_callback_query(filters.regex("GetQueued") & ~BANNED_USERS)
 @languageCB
 async def queued_tracks(client, CallbackQuery: CallbackQuery, _):
@@ -154,34 +187,36 @@ async def queued_tracks(client, CallbackQuery: CallbackQuery, _):
         return await CallbackQuery.answer(_["queue_5"], show_alert=True)
     await CallbackQuery.answer()
     basic[videoid] = False
-    buttons = queue_back_markup(_, what)
-    med = InputMediaPhoto(
-        media="https://telegra.ph//file/6f7d35131f69951c74ee5.jpg",
-        caption=_["queue_1"],
+    med = InputMediaPhoto(media=QUEUE_IMG, caption=_render(chat_id, got, 0))
+    await CallbackQuery.edit_message_media(
+        media=med, reply_markup=queue_page_markup(_, what, 0, _page_count(got))
     )
-    await CallbackQuery.edit_message_media(media=med)
-    j = 0
-    msg = ""
-    for x in got:
-        j += 1
-        if j == 1:
-            msg += f'Streaming :\n\n✨ Title : {x["title"]}\nDuration : {x["dur"]}\nBy : {x["by"]}\n\n'
-        elif j == 2:
-            msg += f'Queued :\n\n✨ Title : {x["title"]}\nDuration : {x["dur"]}\nBy : {x["by"]}\n\n'
-        else:
-            msg += f'✨ Title : {x["title"]}\nDuration : {x["dur"]}\nBy : {x["by"]}\n\n'
-    if "Queued" in msg:
-        if len(msg) < 700:
-            await asyncio.sleep(1)
-            return await CallbackQuery.edit_message_text(msg, reply_markup=buttons)
-        if "✨" in msg:
-            msg = msg.replace("✨", "")
-        link = await DESTINYBIN(msg)
-        med = InputMediaPhoto(media=link, caption=_["queue_3"].format(link))
-        await CallbackQuery.edit_message_media(media=med, reply_markup=buttons)
-    else:
-        await asyncio.sleep(1)
-        return await CallbackQuery.edit_message_text(msg, reply_markup=buttons)
+
+
+@app.on_callback_query(filters.regex("QueuePage") & ~BANNED_USERS)
+@languageCB
+async def queue_page(client, CallbackQuery: CallbackQuery, _):
+    callback_data = CallbackQuery.data.strip()
+    callback_request = callback_data.split(None, 1)[1]
+    what, page = callback_request.split("|")
+    try:
+        chat_id, channel = await get_channeplayCB(_, what, CallbackQuery)
+    except:
+        return
+    if not await is_active_chat(chat_id):
+        return await CallbackQuery.answer(_["general_5"], show_alert=True)
+    got = db.get(chat_id)
+    if not got or len(got) == 1:
+        return await CallbackQuery.answer(_["queue_5"], show_alert=True)
+    await CallbackQuery.answer()
+    total = _page_count(got)
+    page = min(int(page), total - 1)
+    try:
+        await CallbackQuery.edit_message_caption(
+            _render(chat_id, got, page), reply_markup=queue_page_markup(_, what, page, total)
+        )
+    except MessageNotModified:
+        pass
 
 
 @app.on_callback_query(filters.regex("queue_back_timer") & ~BANNED_USERS)
@@ -0,0 +1,33 @@
+import time
+from collections import OrderedDict
+
+# Chats each assistant is in, oldest activity first
+index = {}
+
+
+def touch(assistant_id: int, chat_id: int) -> None:
+    chats = index.setdefault(assistant_id, OrderedDict())
+    chats[chat_id] = time.time()
+    chats.move_to_end(chat_id)
+
+
+def forget(assistant_id: int, chat_id: int) -> None:
+    chats = index.get(assistant_id)
+    if chats:
+        chats.pop(chat_id, None)
+
+
+def oldest_idle(assistant_id: int, idle_for: float, limit: int) -> list:
+    cutoff = time.time() - idle_for
+    found = []
+    for chat_id, seen in (index.get(assistant_id) or {}).items():
+        if seen > cutoff or len(found) >= limit:
+            break
+        found.append(chat_id)
+    return found
+
+
+def seed(assistant_id: int, dialogs: dict) -> None:
+    for chat_id, seen in (index.get(assistant_id) or {}).items():
+        dialogs[chat_id] = max(seen, dialogs.get(chat_id, 0))
+    index[assistant_id] = OrderedDict(sorted(dialogs.items(), key=lambda item: item[1]))
@@ -3,6 +3,7 @@ from typing import Dict, List, Union
 
 from DESTINYMUSIC import userbot
 from DESTINYMUSIC.core.mongo import mongodb
+from DESTINYMUSIC.utils.cache import TTLCache
 
 authdb = mongodb.adminauth
 authuserdb = mongodb.authuser
@@ -18,6 +19,8 @@ langdb = mongodb.language
 onoffdb = mongodb.onoffper
 playmodedb = mongodb.playmode
 playtypedb = mongodb.playtypedb
+playlistdb = mongodb.playlists
+queuesnapdb = mongodb.queuesnapshots
 skipdb = mongodb.skipmode
 sudoersdb = mongodb.sudoers
 usersdb = mongodb.tgusersdb
@@ -34,6 +37,9 @@ loop = {}
 maintenance = []
 nonadmin = {}
 pause = {}
+playlists = TTLCache(30 * 60, maxsize=64)
+playlist_names = TTLCache(30 * 60, maxsize=1024)
+playlist_indexed = []
 playmode = {}
 playtype = {}
 skipmode = {}
@@ -198,19 +204,22 @@ async def set_upvotes(chat_id: int, mode: int):
 
 async def is_autoend() -> bool:
     chat_id = 1234
-    user = await autoenddb.find_one({"chat_id": chat_id})
-    if not user:
-        return False
-    return True
+    mode = autoend.get(chat_id)
+    if mode is None:
+        mode = bool(await autoenddb.find_one({"chat_id": chat_id}))
+        autoend[chat_id] = mode
+    return mode
 
 
 async def autoend_on():
     chat_id = 1234
-    await autoenddb.insert_one({"chat_id": chat_id})
+    autoend[chat_id] = True
+    await autoenddb.update_one({"chat_id": chat_id}, {"$set": {"chat_id": chat_id}}, upsert=True)
 
 
 async def autoend_off():
     chat_id = 1234
+    autoend[chat_id] = False
     await autoenddb.delete_one({"chat_id": chat_id})
 
 
@@ -225,6 +234,65 @@ async def set_loop(chat_id: int, mode: int):
     loop[chat_id] = mode
 
 
+async def save_queue_snapshot(chat_id: int, snapshot: dict):
+    await queuesnapdb.update_one(
+        {"chat_id": chat_id}, {"$set": snapshot}, upsert=True
+    )
+
+
+async def get_queue_snapshots() -> list:
+    return [snap async for snap in queuesnapdb.find({"chat_id": {"$lt": 0}})]
+
+
+async def remove_queue_snapshots(keep: list = None):
+    await queuesnapdb.delete_many({"chat_id": {"$nin": keep or []}})
+
+
+async def _index_playlists():
+    if not playlist_indexed:
+        await playlistdb.create_index([("owner_id", 1), ("name", 1)], unique=True)
+        playlist_indexed.append(True)
+
+
+async def get_playlist_names(owner_id: int) -> List[str]:
+    names = playlist_names.get(owner_id)
+    if names is None:
+        names = [
+            data["name"]
+            async for data in playlistdb.find(
+                {"owner_id": owner_id, "name": {"$exists": True}}, {"name": 1}
+            )
+        ]
+        playlist_names[owner_id] = names
+    return names
+
+
+async def get_playlist(owner_id: int, name: str) -> Union[dict, None]:
+    note = playlists.get((owner_id, name))
+    if note is None:
+        note = await playlistdb.find_one({"owner_id": owner_id, "name": name})
+        if not note:
+            return None
+        playlists[(owner_id, name)] = note
+    return note
+
+
+async def save_playlist(owner_id: int, name: str, note: dict):
+    await _index_playlists()
+    await playlistdb.update_one(
+        {"owner_id": owner_id, "name": name}, {"$set": note}, upsert=True
+    )
+    playlists[(owner_id, name)] = dict(note, owner_id=owner_id, name=name)
+    playlist_names.pop(owner_id)
+
+
+async def delete_playlist(owner_id: int, name: str) -> bool:
+    playlists.pop((owner_id, name))
+    playlist_names.pop(owner_id)
+    data = await playlistdb.delete_one({"owner_id": owner_id, "name": name})
+    return bool(data.deleted_count)
+
+
 async def get_cmode(chat_id: int) -> int:
     mode = channelconnect.get(chat_id)
     if not mode:
@@ -24,13 +24,13 @@ from DESTINYMUSIC.utils.database import (
     is_maintenance,
 )
 from DESTINYMUSIC.utils.inline import botplaylist_markup
-
-# Cache for invite links per chat
-links = {}
+from DESTINYMUSIC.utils.metrics import PlayTrace
+from DESTINYMUSIC.utils.warmup import is_warm, links, mark_warm
 
 
 def PlayWrapper(command):
     async def wrapper(client, message):
+        trace = PlayTrace(message.chat.id)
         language = await get_lang(message.chat.id)
         _ = get_string(language)
 
@@ -119,13 +119,16 @@ def PlayWrapper(command):
         else:
             fplay = None
 
-        if not await is_active_chat(chat_id):
+        trace.mark("checks")
+        if not await is_active_chat(chat_id) and not await is_warm(chat_id):
             userbot = await get_assistant(chat_id)
             try:
                 try:
                     member = await app.get_chat_member(chat_id, userbot.id)
                 except ChatAdminRequired:
                     return await message.reply_text(_["call_1"])
+                finally:
+                    trace.mark("get_chat_member")
 
                 if member.status in (
                     ChatMemberStatus.BANNED,
@@ -147,9 +150,8 @@ def PlayWrapper(command):
                         ),
                     )
             except UserNotParticipant:
-                if chat_id in links:
-                    invitelink = links[chat_id]
-                else:
+                invitelink = links.get(chat_id)
+                if not invitelink:
                     if message.chat.username:
                         invitelink = message.chat.username
                         try:
@@ -177,8 +179,7 @@ def PlayWrapper(command):
                     await userbot.join_chat(invitelink)
                 except InviteHashExpired:
                     # Remove expired invite link from the cache.
-                    if chat_id in links:
-                        del links[chat_id]
+                    links.pop(chat_id)
                     # Generate a new invite link.
                     try:
                         invitelink = await app.export_chat_invite_link(chat_id)
@@ -212,14 +213,17 @@ def PlayWrapper(command):
                     )
 
                 links[chat_id] = invitelink
+                trace.mark("join_chat")
 
                 try:
                     await userbot.resolve_peer(chat_id)
                 except Exception:
                     pass
+                trace.mark("resolve_peer")
+            mark_warm(chat_id, userbot.id)
 
         return await command(
-            client, message, _, chat_id, video, channel, playmode, url, fplay
+            client, message, _, chat_id, video, channel, playmode, url, fplay, trace=trace
         )
 
     return wrapper
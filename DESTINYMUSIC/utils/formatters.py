@@ -1,6 +1,3 @@
-import json
-import subprocess
-
 def get_readable_time(seconds: int) -> str:
     count = 0
     ping_time = ""
@@ -115,34 +112,6 @@ def speed_converter(seconds, speed):
     return "-"
 
 
-def check_duration(file_path):
-    command = [
-        "ffprobe",
-        "-loglevel",
-        "quiet",
-        "-print_format",
-        "json",
-        "-show_format",
-        "-show_streams",
-        file_path,
-    ]
-
-    pipe = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    out, err = pipe.communicate()
-    _json = json.loads(out)
-
-    if "format" in _json:
-        if "duration" in _json["format"]:
-            return float(_json["format"]["duration"])
-
-    if "streams" in _json:
-        for s in _json["streams"]:
-            if "duration" in s:
-                return float(s["duration"])
-
-    return "Unknown"
-
-
 formats = [
     "webm",
     "mkv",
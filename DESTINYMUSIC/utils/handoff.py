@@ -0,0 +1,15 @@
+from DESTINYMUSIC.utils.cache import TTLCache
+
+HANDOFF_TTL = 5 * 60
+
+# Track details resolved by /play, per (video id, user), for the stream buttons
+tracks = TTLCache(HANDOFF_TTL, maxsize=2048)
+
+
+def remember(vidid: str, user_id, details: dict) -> None:
+    if vidid and details:
+        tracks[(vidid, int(user_id))] = details
+
+
+def recall(vidid: str, user_id):
+    return tracks.get((vidid, int(user_id)))
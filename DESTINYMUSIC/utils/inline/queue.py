@@ -62,6 +62,38 @@ def queue_back_markup(_, CPLAY):
     return upl
 
 
+def queue_page_markup(_, CPLAY, page, pages):
+    upl = InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton(
+                    text="◁",
+                    callback_data=f"QueuePage {CPLAY}|{(page - 1) % pages}",
+                ),
+                InlineKeyboardButton(
+                    text=f"{page + 1}/{pages}",
+                    callback_data="GetTimer",
+                ),
+                InlineKeyboardButton(
+                    text="▷",
+                    callback_data=f"QueuePage {CPLAY}|{(page + 1) % pages}",
+                ),
+            ],
+            [
+                InlineKeyboardButton(
+                    text=_["BACK_BUTTON"],
+                    callback_data=f"queue_back_timer {CPLAY}",
+                ),
+                InlineKeyboardButton(
+                    text=_["CLOSE_BUTTON"],
+                    callback_data="close",
+                ),
+            ],
+        ]
+    )
+    return upl
+
+
 def aq_markup(_, chat_id):
     buttons = [
         [
@@ -0,0 +1,115 @@
+import time
+from collections import defaultdict, deque
+from typing import Dict, Tuple
+
+SAMPLE_WINDOW = 500
+
+_samples = defaultdict(lambda: deque(maxlen=SAMPLE_WINDOW))
+_counters = defaultdict(int)
+_started = time.time()
+
+
+def _key(name: str, labels: dict) -> Tuple[str, tuple]:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def observe(name: str, value: float, **labels) -> None:
+    _samples[_key(name, labels)].append(float(value))
+
+
+def inc(name: str, amount: int = 1, **labels) -> None:
+    _counters[_key(name, labels)] += amount
+
+
+def _percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def summary(name: str) -> Dict[tuple, dict]:
+    out = {}
+    for (metric, labels), values in list(_samples.items()):
+        if metric != name or not values:
+            continue
+        ordered = sorted(values)
+        out[labels] = {
+            "count": len(ordered),
+            "p50": _percentile(ordered, 50),
+            "p95": _percentile(ordered, 95),
+            "max": ordered[-1],
+        }
+    return out
+
+
+def counters(name: str) -> Dict[tuple, int]:
+    return {labels: value for (metric, labels), value in list(_counters.items()) if metric == name}
+
+
+recent_traces = deque(maxlen=20)
+
+
+class PlayTrace:
+    def __init__(self, chat_id: int, streamtype: str = "unknown"):
+        self.chat_id = chat_id
+        self.streamtype = streamtype
+        self.started = time.monotonic()
+        self.last = self.started
+        self.phases = []
+
+    def mark(self, phase: str) -> None:
+        now = time.monotonic()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def finish(self, streamtype: str = None) -> None:
+        if streamtype:
+            self.streamtype = str(streamtype)
+        for phase, took in self.phases:
+            observe("play_phase_seconds", took, phase=phase, streamtype=self.streamtype)
+        observe("play_total_seconds", self.last - self.started, streamtype=self.streamtype)
+        recent_traces.append(self)
+
+    def __str__(self) -> str:
+        steps = " → ".join(f"{phase} {took:.2f}s" for phase, took in self.phases)
+        return f"{self.chat_id} [{self.streamtype}] {self.last - self.started:.2f}s : {steps}"
+
+
+def _labels_text(labels: tuple, extra: str = "") -> str:
+    parts = [f'{k}="{v}"' for k, v in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def render_prometheus() -> str:
+    lines = []
+    for name in sorted({metric for metric, _ in list(_samples)}):
+        lines.append(f"# TYPE destiny_{name} summary")
+        for labels, stats in summary(name).items():
+            values = _samples[(name, labels)]
+            for quantile, key in (("0.5", "p50"), ("0.95", "p95")):
+                tag = _labels_text(labels, 'quantile="%s"' % quantile)
+                lines.append(f"destiny_{name}{tag} {stats[key]:.6f}")
+            lines.append(f"destiny_{name}_sum{_labels_text(labels)} {sum(values):.6f}")
+            lines.append(f"destiny_{name}_count{_labels_text(labels)} {len(values)}")
+    for name in sorted({metric for metric, _ in list(_counters)}):
+        lines.append(f"# TYPE destiny_{name} counter")
+        for labels, value in counters(name).items():
+            lines.append(f"destiny_{name}{_labels_text(labels)} {value}")
+    lines.append(f"destiny_uptime_seconds {time.time() - _started:.0f}")
+    return "\n".join(lines) + "\n"
+
+
+async def start_exporter(port: int) -> None:
+    from aiohttp import web
+
+    async def handler(request):
+        return web.Response(text=render_prometheus(), content_type="text/plain")
+
+    server = web.Application()
+    server.router.add_get("/metrics", handler)
+    runner = web.AppRunner(server)
+    await runner.setup()
+    await web.TCPSite(runner, "0.0.0.0", port).start()
@@ -0,0 +1,115 @@
+import asyncio
+import json
+import os
+from typing import Union
+
+from DESTINYMUSIC import LOGGER
+from DESTINYMUSIC.utils.cache import TTLCache
+
+PROBE_WORKERS = 4
+PROBE_TIMEOUT = 20
+PROBE_WINDOW = 10
+FILE_TTL = 6 * 60 * 60
+URL_TTL = 10 * 60
+
+results = TTLCache(FILE_TTL, maxsize=2048)
+pending = {}
+_slots = asyncio.Semaphore(PROBE_WORKERS)
+
+
+class MediaInfo:
+    __slots__ = ("duration", "bitrate", "audio_codec", "video_codec", "keyframe_interval")
+
+    def __init__(self, data: dict):
+        fmt = data.get("format") or {}
+        streams = data.get("streams") or []
+        self.duration = _number(fmt.get("duration"))
+        self.bitrate = int(_number(fmt.get("bit_rate")) or 0)
+        self.audio_codec = None
+        self.video_codec = None
+        video_index = None
+        for s in streams:
+            if s.get("codec_type") == "audio" and not self.audio_codec:
+                self.audio_codec = s.get("codec_name")
+            elif s.get("codec_type") == "video" and not self.video_codec:
+                self.video_codec = s.get("codec_name")
+                video_index = s.get("index")
+            if not self.duration:
+                self.duration = _number(s.get("duration"))
+        keyframes = [
+            _number(p.get("pts_time"))
+            for p in data.get("packets") or []
+            if p.get("stream_index") == video_index and "K" in (p.get("flags") or "")
+        ]
+        keyframes = [k for k in keyframes if k is not None]
+        self.keyframe_interval = (
+            (keyframes[-1] - keyframes[0]) / (len(keyframes) - 1) if len(keyframes) > 1 else None
+        )
+
+
+def _number(value) -> Union[float, None]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _key(path: str):
+    if "://" in path:
+        return path, None
+    try:
+        return path, os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+async def _run(path: str) -> Union[MediaInfo, None]:
+    command = [
+        "ffprobe", "-loglevel", "quiet", "-print_format", "json",
+        "-show_entries",
+        "format=duration,bit_rate:stream=index,codec_type,codec_name,duration"
+        ":packet=stream_index,pts_time,flags",
+        "-read_intervals", f"%+{PROBE_WINDOW}",
+    ]
+    if "://" in path:
+        command += ["-rw_timeout", str(PROBE_TIMEOUT * 1000000)]
+    async with _slots:
+        proc = await asyncio.create_subprocess_exec(
+            *command, path, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            out, _ = await asyncio.wait_for(proc.communicate(), PROBE_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return None
+    try:
+        return MediaInfo(json.loads(out or b"{}"))
+    except ValueError:
+        return None
+
+
+async def probe(path: str) -> Union[MediaInfo, None]:
+    key = _key(path)
+    if key is None:
+        return None
+    info = results.get(key)
+    if info is not None:
+        return info
+    task = pending.get(key)
+    if task is None:
+        task = pending[key] = asyncio.ensure_future(_run(path))
+        task.add_done_callback(lambda _: pending.pop(key, None))
+    try:
+        info = await asyncio.shield(task)
+    except Exception as e:
+        LOGGER(__name__).info(f"ffprobe failed for {path}: {e}")
+        return None
+    if info is not None:
+        results.set(key, info, URL_TTL if key[1] is None else None)
+    return info
+
+
+async def duration(path: str) -> Union[float, None]:
+    info = await probe(path)
+    return info.duration if info else None
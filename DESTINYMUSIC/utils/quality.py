@@ -0,0 +1,87 @@
+import psutil
+from pytgcalls.types import AudioQuality, VideoQuality
+
+import config
+from DESTINYMUSIC.utils import metrics
+from DESTINYMUSIC.utils.database import activevideo, assistantdict
+
+AUDIO_STEPS = [AudioQuality.STUDIO, AudioQuality.HIGH, AudioQuality.MEDIUM, AudioQuality.LOW]
+VIDEO_STEPS = [VideoQuality.HD_720p, VideoQuality.SD_480p, VideoQuality.SD_480p, VideoQuality.SD_360p]
+PRESETS = {"high": 0, "medium": 2, "low": 3}
+
+CPU_HIGH = 85
+CPU_LOW = 55
+STALLS_HIGH = 2
+HOLD_DOWN = 3
+HOLD_UP = 6
+STREAMS_PER_STEP = 25
+VIDEO_WEIGHT = 4
+
+overrides = {}
+admission = {}
+state = {"level": 0, "floor": 0, "cpu": 0.0, "hot": 0, "cool": 0, "stalls": 0}
+
+
+def current_level() -> int:
+    return max(state["level"], state["floor"])
+
+
+def sample(active: int, video: int) -> int:
+    cpu = psutil.cpu_percent(interval=None)
+    stalls = sum(metrics.counters("stream_stalls_total").values())
+    new_stalls = stalls - state["stalls"]
+    before = current_level()
+    state.update(cpu=cpu, stalls=stalls)
+    state["floor"] = min(len(AUDIO_STEPS) - 1, (active + VIDEO_WEIGHT * video) // STREAMS_PER_STEP)
+
+    if cpu > CPU_HIGH or new_stalls >= STALLS_HIGH:
+        state["hot"], state["cool"] = state["hot"] + 1, 0
+    elif cpu < CPU_LOW and not new_stalls:
+        state["hot"], state["cool"] = 0, state["cool"] + 1
+    else:
+        state["hot"] = state["cool"] = 0
+
+    if state["hot"] >= HOLD_DOWN and state["level"] < len(AUDIO_STEPS) - 1:
+        state["level"] += 1
+        state["hot"] = 0
+    elif state["cool"] >= HOLD_UP and state["level"] > 0:
+        state["level"] -= 1
+        state["cool"] = 0
+
+    after = current_level()
+    if after != before:
+        metrics.inc("quality_level_changes_total", direction="down" if after > before else "up")
+    return after
+
+
+def _tier(used: int, limit: int) -> int:
+    if not limit or used < limit:
+        return 0
+    if used < limit + max(1, limit // 2):
+        return 1
+    return 2
+
+
+def admit_video(chat_id: int) -> str:
+    others = [c for c in activevideo if c != chat_id]
+    assistant = assistantdict.get(chat_id)
+    on_assistant = sum(1 for c in others if assistantdict.get(c) == assistant)
+    tier = max(
+        _tier(len(others), config.VIDEO_STREAM_LIMIT),
+        _tier(on_assistant, config.ASSISTANT_VIDEO_LIMIT),
+    )
+    decision = ("hd", "sd", "audio")[tier]
+    admission[chat_id] = decision
+    metrics.inc("video_admissions_total", decision=decision)
+    return decision
+
+
+def profile(chat_id: int = None, video: bool = False):
+    step = overrides.get(chat_id)
+    if step is None:
+        step = current_level()
+    if video:
+        if admission.get(chat_id) == "sd":
+            return AUDIO_STEPS[max(step, 2)], VIDEO_STEPS[-1]
+        return AUDIO_STEPS[step], VIDEO_STEPS[step]
+    return AUDIO_STEPS[step], VideoQuality.SD_360p
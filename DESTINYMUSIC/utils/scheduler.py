@@ -0,0 +1,44 @@
+import asyncio
+import heapq
+import time
+
+
+class DeadlineScheduler:
+    def __init__(self, callback):
+        self.callback = callback
+        self._heap = []
+        self._deadlines = {}
+        self._wakeup = asyncio.Event()
+
+    def schedule(self, key, delay: float) -> None:
+        when = time.monotonic() + delay
+        self._deadlines[key] = when
+        heapq.heappush(self._heap, (when, key))
+        if self._heap[0][1] == key:
+            self._wakeup.set()
+
+    def cancel(self, key) -> None:
+        self._deadlines.pop(key, None)
+
+    def __contains__(self, key) -> bool:
+        return key in self._deadlines
+
+    def _prune(self) -> None:
+        while self._heap and self._deadlines.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    async def run(self) -> None:
+        while True:
+            self._prune()
+            timeout = max(0, self._heap[0][0] - time.monotonic()) if self._heap else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            now = time.monotonic()
+            while self._heap and self._heap[0][0] <= now:
+                when, key = heapq.heappop(self._heap)
+                if self._deadlines.get(key) == when:
+                    del self._deadlines[key]
+                    asyncio.create_task(self.callback(key))
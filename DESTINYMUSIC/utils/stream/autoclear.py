@@ -1,18 +1,95 @@
 import os
+from collections import OrderedDict
 
-from config import autoclean
+from config import MEDIA_CACHE_LIMIT
 
+CACHE_DIRS = ("downloads",)
 
-async def auto_clean(popped):
-    try:
-        rem = popped["file"]
-        autoclean.remove(rem)
-        count = autoclean.count(rem)
-        if count == 0:
-            if "vid_" not in rem or "live_" not in rem or "index_" not in rem:
+refs = {}
+idle = OrderedDict()
+cached = [0]
+
+
+def _local(path: str) -> bool:
+    return bool(path) and not path.startswith(("vid_", "live_", "index_")) and os.path.isfile(path)
+
+
+def _seed() -> None:
+    found = []
+    for folder in CACHE_DIRS:
+        try:
+            entries = list(os.scandir(folder))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.endswith(".part"):
+                # Left over from a transfer interrupted by a restart.
                 try:
-                    os.remove(rem)
-                except:
+                    os.remove(entry.path)
+                except OSError:
                     pass
-    except:
+            elif entry.is_file():
+                stat = entry.stat()
+                found.append((stat.st_atime, entry.path, stat.st_size))
+    for _, path, size in sorted(found):
+        idle[path] = size
+        cached[0] += size
+
+
+def acquire(path: str) -> None:
+    refs[path] = refs.get(path, 0) + 1
+    size = idle.pop(path, None)
+    if size is not None:
+        cached[0] -= size
+
+
+def release(path: str) -> None:
+    count = refs.get(path, 0) - 1
+    if count > 0:
+        refs[path] = count
+        return
+    refs.pop(path, None)
+    if not _local(path):
+        return
+    size = os.path.getsize(path)
+    idle[path] = size
+    idle.move_to_end(path)
+    cached[0] += size
+    evict()
+
+
+def evict(limit: int = None) -> int:
+    limit = MEDIA_CACHE_LIMIT if limit is None else limit
+    removed = 0
+    while idle and cached[0] > limit:
+        path, size = idle.popitem(last=False)
+        cached[0] -= size
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def claim(entry, path: str) -> None:
+    # Pin the file a vid_ entry was downloaded to for as long as the entry is queued.
+    if path in (entry["file"], entry["path"]):
+        return
+    old = entry["path"]
+    entry["path"] = path
+    acquire(path)
+    if old:
+        release(old)
+
+
+async def auto_clean(popped):
+    try:
+        release(popped["file"])
+        if popped["path"]:
+            release(popped["path"])
+    except Exception:
         pass
+
+
+_seed()
@@ -1,9 +1,205 @@
 import asyncio
+import random
+from collections import deque
+from itertools import islice
 from typing import Union
 
+import config
+from DESTINYMUSIC import LOGGER, YouTube
 from DESTINYMUSIC.misc import db
-from DESTINYMUSIC.utils.formatters import check_duration, seconds_to_min
-from config import autoclean, time_to_seconds
+from DESTINYMUSIC.utils import probe
+from DESTINYMUSIC.utils.formatters import seconds_to_min
+from DESTINYMUSIC.utils.stream.autoclear import acquire
+from config import time_to_seconds
+
+
+class Track:
+    __slots__ = (
+        "title", "dur", "streamtype", "by", "user_id", "chat_id", "file", "vidid",
+        "seconds", "played", "mystic", "markup", "old_dur", "old_second",
+        "speed_path", "speed", "source", "expires", "lazy", "path",
+    )
+    TRANSIENT = ("mystic", "markup", "path")
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+        self.played = self.played or 0
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value) -> None:
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return getattr(self, key, None) is not None
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def update(self, fields: dict) -> None:
+        for key, value in fields.items():
+            self[key] = value
+
+    def as_dict(self) -> dict:
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name not in self.TRANSIENT and getattr(self, name) is not None
+        }
+
+
+class Queue(deque):
+    def __init__(self, tracks=()):
+        super().__init__(tracks)
+        self.version = 0
+
+    @property
+    def head(self) -> Union[Track, None]:
+        return self[0] if self else None
+
+    def push(self, track: Track) -> None:
+        self.append(track)
+        self.version += 1
+
+    def push_head(self, track: Track) -> None:
+        self.appendleft(track)
+        self.version += 1
+
+    def pop_head(self) -> Track:
+        track = self.popleft()
+        self.version += 1
+        return track
+
+    def remove_at(self, index: int) -> Track:
+        track = self[index]
+        del self[index]
+        self.version += 1
+        return track
+
+    def move(self, src: int, dst: int) -> None:
+        track = self.remove_at(src)
+        self.insert(dst, track)
+
+    def shuffle(self) -> None:
+        if len(self) < 3:
+            return
+        head = self.popleft()
+        rest = list(self)
+        random.shuffle(rest)
+        self.clear()
+        self.append(head)
+        self.extend(rest)
+        self.version += 1
+
+    def snapshot(self) -> list:
+        return [track.as_dict() for track in self]
+
+
+FILL_LIMIT = 25
+FILL_CONCURRENCY = 3
+
+resolving = {}
+filling = {}
+_fill_slots = asyncio.Semaphore(FILL_CONCURRENCY)
+
+
+def _preload(chat_id):
+    from DESTINYMUSIC.core.call import JARVIS
+
+    if len(db.get(chat_id) or []) == 2:
+        JARVIS.preload_next(chat_id)
+
+
+async def _resolve(track: Track) -> Union[bool, None]:
+    try:
+        title, duration_min, duration_sec, _, vidid = await YouTube.details(
+            track.lazy, track.vidid is not None
+        )
+    except ValueError:
+        return False
+    except Exception as e:
+        LOGGER(__name__).warning(f"Could not resolve {track.lazy}, keeping it queued: {e}")
+        return None
+    if str(duration_min) == "None" or duration_sec > config.DURATION_LIMIT:
+        return False
+    if not track.lazy:
+        return True
+    track.title = title.title()
+    track.dur = duration_min
+    track.seconds = max(duration_sec - 3, 0)
+    track.vidid = vidid
+    track.file = f"vid_{vidid}"
+    track.lazy = None
+    return True
+
+
+# False when the track is unplayable, None when the lookup failed and may be retried.
+async def resolve_track(track: Track) -> Union[bool, None]:
+    if not track.lazy:
+        return True
+    task = resolving.get(id(track))
+    if task is None:
+        task = resolving[id(track)] = asyncio.ensure_future(_resolve(track))
+        task.add_done_callback(lambda _: resolving.pop(id(track), None))
+    return await asyncio.shield(task)
+
+
+def fill_titles(chat_id: int) -> None:
+    running = filling.get(chat_id)
+    if running and not running.done():
+        return
+    filling[chat_id] = asyncio.create_task(_fill(chat_id))
+
+
+async def _fill(chat_id: int) -> None:
+    check = db.get(chat_id)
+    if not check:
+        return
+    pending = [track for track in islice(check, FILL_LIMIT) if track.lazy]
+
+    async def fill(track):
+        async with _fill_slots:
+            if db.get(chat_id) is check:
+                await resolve_track(track)
+
+    await asyncio.gather(*(fill(track) for track in pending))
+    check.version += 1
+
+
+async def put_queue_lazy(chat_id, original_chat_id, refs, user, user_id, stream, videoid=True) -> int:
+    check = db.get(chat_id)
+    if check is None:
+        check = db[chat_id] = Queue()
+    for ref in refs:
+        check.append(
+            Track(
+                title=ref if videoid else ref[:70],
+                dur="--:--",
+                streamtype=stream,
+                by=user,
+                user_id=user_id,
+                chat_id=original_chat_id,
+                file=f"vid_{ref}",
+                vidid=ref if videoid else None,
+                seconds=0,
+                lazy=ref,
+            )
+        )
+    check.version += 1
+    from DESTINYMUSIC.core.call import JARVIS
+
+    JARVIS.preload_next(chat_id)
+    fill_titles(chat_id)
+    return len(check) - 1
 
 
 async def put_queue(
@@ -23,28 +219,27 @@ async def put_queue(
         duration_in_seconds = time_to_seconds(duration) - 3
     except:
         duration_in_seconds = 0
-    put = {
-        "title": title,
-        "dur": duration,
-        "streamtype": stream,
-        "by": user,
-        "user_id": user_id,
-        "chat_id": original_chat_id,
-        "file": file,
-        "vidid": vidid,
-        "seconds": duration_in_seconds,
-        "played": 0,
-    }
+    put = Track(
+        title=title,
+        dur=duration,
+        streamtype=stream,
+        by=user,
+        user_id=user_id,
+        chat_id=original_chat_id,
+        file=file,
+        vidid=vidid,
+        seconds=duration_in_seconds,
+    )
     if forceplay:
         check = db.get(chat_id)
         if check:
-            check.insert(0, put)
+            check.push_head(put)
         else:
-            db[chat_id] = []
-            db[chat_id].append(put)
+            db[chat_id] = Queue([put])
     else:
-        db[chat_id].append(put)
-    autoclean.append(file)
+        db[chat_id].push(put)
+    acquire(file)
+    _preload(chat_id)
 
 
 async def put_queue_index(
@@ -58,34 +253,61 @@ async def put_queue_index(
     stream,
     forceplay: Union[bool, str] = None,
 ):
-    if "20.212.146.162" in vidid:
-        try:
-            dur = await asyncio.get_event_loop().run_in_executor(
-                None, check_duration, vidid
-            )
-            duration = seconds_to_min(dur)
-        except:
-            duration = "ᴜʀʟ sᴛʀᴇᴀᴍ"
-            dur = 0
-    else:
-        dur = 0
-    put = {
-        "title": title,
-        "dur": duration,
-        "streamtype": stream,
-        "by": user,
-        "chat_id": original_chat_id,
-        "file": file,
-        "vidid": vidid,
-        "seconds": dur,
-        "played": 0,
-    }
+    put = Track(
+        title=title,
+        dur="ᴜʀʟ sᴛʀᴇᴀᴍ",
+        streamtype=stream,
+        by=user,
+        chat_id=original_chat_id,
+        file=file,
+        vidid=vidid,
+        seconds=0,
+    )
+    # Live HLS has no duration, anything else is probed without holding up the command.
+    if ".m3u8" not in vidid.lower():
+        asyncio.create_task(_probe_index(chat_id, put))
     if forceplay:
         check = db.get(chat_id)
         if check:
-            check.insert(0, put)
+            check.push_head(put)
         else:
-            db[chat_id] = []
-            db[chat_id].append(put)
+            db[chat_id] = Queue([put])
     else:
-        db[chat_id].append(put)
+        db[chat_id].push(put)
+    _preload(chat_id)
+
+
+async def _probe_index(chat_id: int, track: Track) -> None:
+    dur = int(await probe.duration(track.vidid) or 0)
+    if not dur:
+        return
+    track.dur = seconds_to_min(dur)
+    track.seconds = dur
+    check = db.get(chat_id)
+    if check:
+        check.version += 1
+
+
+async def put_queue_tracks(chat_id, original_chat_id, tracks, user, user_id, stream) -> int:
+    check = db.get(chat_id)
+    if check is None:
+        check = db[chat_id] = Queue()
+    check.extend(
+        Track(
+            title=track["title"],
+            dur=track["dur"],
+            streamtype=stream,
+            by=user,
+            user_id=user_id,
+            chat_id=original_chat_id,
+            file=f"vid_{track['vidid']}",
+            vidid=track["vidid"],
+            seconds=max(int(track["seconds"]) - 3, 0),
+        )
+        for track in tracks
+    )
+    check.version += 1
+    from DESTINYMUSIC.core.call import JARVIS
+
+    JARVIS.preload_next(chat_id)
+    return len(check) - 1
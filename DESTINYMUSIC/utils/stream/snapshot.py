@@ -0,0 +1,114 @@
+import asyncio
+import os
+import time
+
+from DESTINYMUSIC import LOGGER
+from DESTINYMUSIC.misc import db
+from DESTINYMUSIC.utils.database import (
+    assistantdict,
+    get_active_chats,
+    get_assistant_number,
+    get_loop,
+    get_queue_snapshots,
+    remove_queue_snapshots,
+    save_queue_snapshot,
+    set_loop,
+)
+from DESTINYMUSIC.utils.stream.autoclear import acquire, release
+from DESTINYMUSIC.utils.stream.queue import Queue, Track
+
+SNAPSHOT_TTL = 30 * 60
+RESTORE_STAGGER = 3
+RESTART_GRACE = 2 * 60
+
+# Until when the snapshot written for a restart is protected from later saves.
+restarting = [0.0]
+_saving = asyncio.Lock()
+
+
+def _usable(entry: Track) -> bool:
+    queued = entry["file"]
+    speed_path = entry.get("speed_path")
+    if speed_path and not os.path.exists(speed_path):
+        entry["speed_path"] = None
+        entry["speed"] = 1.0
+        if entry.get("old_dur"):
+            entry["dur"], entry["seconds"] = entry["old_dur"], entry["old_second"]
+    if "vid_" in queued or "live_" in queued or "index_" in queued:
+        return True
+    if os.path.exists(queued):
+        return True
+    if entry["vidid"] not in ("telegram", "soundcloud"):
+        entry["file"] = f"vid_{entry['vidid']}"
+        return True
+    return False
+
+
+async def save_snapshots(final: bool = False) -> int:
+    async with _saving:
+        if time.monotonic() < restarting[0]:
+            return 0
+        saved = await _save()
+        if final:
+            restarting[0] = time.monotonic() + RESTART_GRACE
+    return saved
+
+
+def resume_snapshots() -> None:
+    restarting[0] = 0.0
+
+
+async def _save() -> int:
+    saved = []
+    for chat_id in await get_active_chats():
+        queue = db.get(chat_id)
+        if not queue:
+            continue
+        await save_queue_snapshot(
+            chat_id,
+            {
+                "queue": queue.snapshot(),
+                "loop": await get_loop(chat_id),
+                "assistant": await get_assistant_number(chat_id),
+                "at": time.time(),
+            },
+        )
+        saved.append(chat_id)
+    await remove_queue_snapshots(saved)
+    return len(saved)
+
+
+async def restore_snapshots() -> None:
+    from DESTINYMUSIC.core.call import JARVIS
+    from DESTINYMUSIC.core.userbot import assistants
+
+    snapshots = await get_queue_snapshots()
+    await remove_queue_snapshots()
+    restored = 0
+    for snap in snapshots:
+        if time.time() - snap.get("at", 0) > SNAPSHOT_TTL:
+            continue
+        chat_id = snap["chat_id"]
+        queue = Queue(
+            entry for entry in (Track(**data) for data in snap.get("queue", [])) if _usable(entry)
+        )
+        if not queue:
+            continue
+        if snap.get("assistant") in assistants:
+            assistantdict[chat_id] = snap["assistant"]
+        db[chat_id] = queue
+        for entry in queue:
+            acquire(entry["file"])
+        await set_loop(chat_id, snap.get("loop", 0))
+        try:
+            await JARVIS.restore_stream(chat_id, int(queue[0].get("played", 0)))
+            restored += 1
+        except Exception as e:
+            LOGGER(__name__).info(f"Could not resume queue in {chat_id}: {e}")
+            for entry in queue:
+                release(entry["file"])
+            db[chat_id] = Queue()
+            await set_loop(chat_id, 0)
+        await asyncio.sleep(RESTORE_STAGGER)
+    if restored:
+        LOGGER(__name__).info(f"Resumed {restored} queue(s) from snapshots.")
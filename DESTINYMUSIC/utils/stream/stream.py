@@ -1,20 +1,18 @@
-import os
-from random import randint
 from typing import Union
 
 from pyrogram.types import InlineKeyboardMarkup
 
 import config
-from DESTINYMUSIC import Carbon, YouTube, app
+from DESTINYMUSIC import YouTube, app
 from DESTINYMUSIC.core.call import JARVIS
 from DESTINYMUSIC.misc import db
-from DESTINYMUSIC.utils.database import add_active_video_chat, is_active_chat
+from DESTINYMUSIC.utils.database import is_active_chat
 from DESTINYMUSIC.utils.exceptions import AssistantErr
 from DESTINYMUSIC.utils.inline import aq_markup, close_markup, stream_markup
-from DESTINYMUSIC.utils.pastebin import DESTINYBIN
-from DESTINYMUSIC.utils.stream.queue import put_queue, put_queue_index
+from DESTINYMUSIC.utils.stream.queue import Queue, put_queue, put_queue_index, put_queue_lazy
 from DESTINYMUSIC.utils.thumbnails import get_thumb
 from DESTINYMUSIC.utils.errors import capture_internal_err
+from DESTINYMUSIC.utils.metrics import PlayTrace
 
 @capture_internal_err
 async def stream(
@@ -29,108 +27,99 @@ async def stream(
     streamtype: Union[bool, str] = None,
     spotify: Union[bool, str] = None,
     forceplay: Union[bool, str] = None,
+    trace: PlayTrace = None,
 ):
     if not result:
         return
+    trace = trace or PlayTrace(chat_id)
     if forceplay:
         await JARVIS.force_stop_stream(chat_id)
     if streamtype == "playlist":
-        msg = f"{_['play_19']}\n\n"
-        count = 0
-        for search in result:
-            if int(count) == config.PLAYLIST_FETCH_LIMIT:
-                continue
-            try:
-                (
-                    title,
-                    duration_min,
-                    duration_sec,
-                    thumbnail,
-                    vidid,
-                ) = await YouTube.details(search, False if spotify else True)
-            except:
-                continue
-            if str(duration_min) == "None":
-                continue
-            if duration_sec > config.DURATION_LIMIT:
-                continue
-            if await is_active_chat(chat_id):
-                await put_queue(
-                    chat_id,
-                    original_chat_id,
-                    f"vid_{vidid}",
-                    title,
-                    duration_min,
-                    user_name,
-                    vidid,
-                    user_id,
-                    "video" if video else "audio",
-                )
-                position = len(db.get(chat_id)) - 1
-                count += 1
-                msg += f"{count}. {title[:70]}\n"
-                msg += f"{_['play_20']} {position}\n\n"
-            else:
-                if not forceplay:
-                    db[chat_id] = []
-                status = True if video else None
+        refs = list(result)[: config.PLAYLIST_FETCH_LIMIT]
+        if not await is_active_chat(chat_id):
+            while refs:
+                search = refs.pop(0)
                 try:
-                    file_path, direct = await YouTube.download(
-                        vidid, mystic, video=status, videoid=True
-                    )
+                    (
+                        title,
+                        duration_min,
+                        duration_sec,
+                        thumbnail,
+                        vidid,
+                    ) = await YouTube.details(search, False if spotify else True)
                 except:
-                    raise AssistantErr(_["play_14"])
-                await JARVIS.join_call(
-                    chat_id,
-                    original_chat_id,
-                    file_path,
-                    video=status,
-                    image=thumbnail,
+                    continue
+                if str(duration_min) == "None":
+                    continue
+                if duration_sec > config.DURATION_LIMIT:
+                    continue
+                break
+            else:
+                return
+            if not forceplay:
+                db[chat_id] = Queue()
+            status = True if video else None
+            try:
+                file_path, direct = await YouTube.download(
+                    vidid, mystic, video=status, videoid=True
                 )
-                await put_queue(
-                    chat_id,
-                    original_chat_id,
-                    file_path if direct else f"vid_{vidid}",
-                    title,
+            except:
+                raise AssistantErr(_["play_14"])
+            trace.mark("download")
+            await JARVIS.join_call(
+                chat_id,
+                original_chat_id,
+                file_path,
+                video=status,
+                image=thumbnail,
+                trace=trace,
+            )
+            await put_queue(
+                chat_id,
+                original_chat_id,
+                file_path if direct else f"vid_{vidid}",
+                title,
+                duration_min,
+                user_name,
+                vidid,
+                user_id,
+                "video" if video else "audio",
+                forceplay=forceplay,
+            )
+            img = await get_thumb(vidid)
+            trace.mark("thumbnail")
+            button = stream_markup(_, chat_id)
+            run = await app.send_photo(
+                original_chat_id,
+                photo=img,
+                caption=_["stream_1"].format(
+                    f"https://t.me/{app.username}?start=info_{vidid}",
+                    title[:23],
                     duration_min,
                     user_name,
-                    vidid,
-                    user_id,
-                    "video" if video else "audio",
-                    forceplay=forceplay,
-                )
-                img = await get_thumb(vidid)
-                button = stream_markup(_, chat_id)
-                run = await app.send_photo(
-                    original_chat_id,
-                    photo=img,
-                    caption=_["stream_1"].format(
-                        f"https://t.me/{app.username}?start=info_{vidid}",
-                        title[:23],
-                        duration_min,
-                        user_name,
-                    ),
-                    reply_markup=InlineKeyboardMarkup(button),
-                )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "stream"
-        if count == 0:
-            return
-        else:
-            link = await DESTINYBIN(msg)
-            lines = msg.count("\n")
-            if lines >= 17:
-                car = os.linesep.join(msg.split(os.linesep)[:17])
-            else:
-                car = msg
-            carbon = await Carbon.generate(car, randint(100, 10000000))
-            upl = close_markup(_)
-            return await app.send_photo(
-                original_chat_id,
-                photo=carbon,
-                caption=_["play_21"].format(position, link),
-                reply_markup=upl,
+                ),
+                reply_markup=InlineKeyboardMarkup(button),
             )
+            trace.mark("send_photo")
+            db[chat_id][0]["mystic"] = run.id
+            db[chat_id][0]["markup"] = "stream"
+        if not refs:
+            return
+        position = await put_queue_lazy(
+            chat_id,
+            original_chat_id,
+            refs,
+            user_name,
+            user_id,
+            "video" if video else "audio",
+            videoid=not spotify,
+        )
+        return await app.send_message(
+            original_chat_id,
+            text=f"» ǫᴜᴇᴜᴇᴅ {len(refs)} ᴛʀᴀᴄᴋs ғʀᴏᴍ ᴛʜᴇ ᴘʟᴀʏʟɪsᴛ, ᴜᴘ ᴛᴏ ᴘᴏsɪᴛɪᴏɴ {position}.\n\n"
+            f"ʙʏ : {user_name}, ʙʀᴏᴡsᴇ ᴛʜᴇᴍ ᴡɪᴛʜ /queue",
+            reply_markup=close_markup(_),
+        )
     elif streamtype == "youtube":
         link = result["link"]
         vidid = result["vidid"]
@@ -144,6 +133,7 @@ async def stream(
             )
         except:
             raise AssistantErr(_["play_14"])
+        trace.mark("download")
         if await is_active_chat(chat_id):
             await put_queue(
                 chat_id,
@@ -165,13 +155,14 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
+                db[chat_id] = Queue()
             await JARVIS.join_call(
                 chat_id,
                 original_chat_id,
                 file_path,
                 video=status,
                 image=thumbnail,
+                trace=trace,
             )
             await put_queue(
                 chat_id,
@@ -186,6 +177,7 @@ async def stream(
                 forceplay=forceplay,
             )
             img = await get_thumb(vidid)
+            trace.mark("thumbnail")
             button = stream_markup(_, chat_id)
             run = await app.send_photo(
                 original_chat_id,
@@ -198,7 +190,8 @@ async def stream(
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
+            trace.mark("send_photo")
+            db[chat_id][0]["mystic"] = run.id
             db[chat_id][0]["markup"] = "stream"
     elif streamtype == "soundcloud":
         file_path = result["filepath"]
@@ -225,8 +218,8 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
-            await JARVIS.join_call(chat_id, original_chat_id, file_path, video=None)
+                db[chat_id] = Queue()
+            await JARVIS.join_call(chat_id, original_chat_id, file_path, video=None, trace=trace)
             await put_queue(
                 chat_id,
                 original_chat_id,
@@ -248,7 +241,8 @@ async def stream(
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
+            trace.mark("send_photo")
+            db[chat_id][0]["mystic"] = run.id
             db[chat_id][0]["markup"] = "tg"
     elif streamtype == "telegram":
         file_path = result["path"]
@@ -277,8 +271,8 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
-            await JARVIS.join_call(chat_id, original_chat_id, file_path, video=status)
+                db[chat_id] = Queue()
+            await JARVIS.join_call(chat_id, original_chat_id, file_path, video=status, trace=trace)
             await put_queue(
                 chat_id,
                 original_chat_id,
@@ -291,8 +285,6 @@ async def stream(
                 "video" if video else "audio",
                 forceplay=forceplay,
             )
-            if video:
-                await add_active_video_chat(chat_id)
             button = stream_markup(_, chat_id)
             run = await app.send_photo(
                 original_chat_id,
@@ -300,7 +292,8 @@ async def stream(
                 caption=_["stream_1"].format(link, title[:23], duration_min, user_name),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
+            trace.mark("send_photo")
+            db[chat_id][0]["mystic"] = run.id
             db[chat_id][0]["markup"] = "tg"
     elif streamtype == "live":
         link = result["link"]
@@ -330,8 +323,9 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
+                db[chat_id] = Queue()
             n, file_path = await YouTube.video(link)
+            trace.mark("download")
             if n == 0:
                 raise AssistantErr(_["str_3"])
             await JARVIS.join_call(
@@ -340,6 +334,7 @@ async def stream(
                 file_path,
                 video=status,
                 image=thumbnail if thumbnail else None,
+                trace=trace,
             )
             await put_queue(
                 chat_id,
@@ -353,7 +348,9 @@ async def stream(
                 "video" if video else "audio",
                 forceplay=forceplay,
             )
+            JARVIS.watch_live(chat_id, file_path)
             img = await get_thumb(vidid)
+            trace.mark("thumbnail")
             button = stream_markup(_, chat_id)
             run = await app.send_photo(
                 original_chat_id,
@@ -366,7 +363,8 @@ async def stream(
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
+            trace.mark("send_photo")
+            db[chat_id][0]["mystic"] = run.id
             db[chat_id][0]["markup"] = "tg"
     elif streamtype == "index":
         link = result
@@ -391,12 +389,13 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
+                db[chat_id] = Queue()
             await JARVIS.join_call(
                 chat_id,
                 original_chat_id,
                 link,
                 video=True if video else None,
+                trace=trace,
             )
             await put_queue_index(
                 chat_id,
@@ -416,6 +415,7 @@ async def stream(
                 caption=_["stream_2"].format(user_name),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
+            trace.mark("send_photo")
+            db[chat_id][0]["mystic"] = run.id
             db[chat_id][0]["markup"] = "tg"
             await mystic.delete()
@@ -0,0 +1,83 @@
+import asyncio
+
+from pyrogram.enums import ChatMemberStatus
+from pyrogram.errors import InviteRequestSent, UserAlreadyParticipant, UserNotParticipant
+
+from DESTINYMUSIC import LOGGER, app
+from DESTINYMUSIC.utils import activity
+from DESTINYMUSIC.utils.cache import TTLCache
+from DESTINYMUSIC.utils.database import get_assistant
+
+MEMBER_TTL = 30 * 60
+LINK_TTL = 6 * 60 * 60
+
+# Invite links per chat, and assistant membership per (chat, assistant)
+links = TTLCache(LINK_TTL)
+members = TTLCache(MEMBER_TTL)
+warming = {}
+
+
+def _invite(link: str) -> str:
+    if link.startswith("https://t.me/+"):
+        return link.replace("https://t.me/+", "https://t.me/joinchat/")
+    return link
+
+
+def mark_warm(chat_id: int, assistant_id: int) -> None:
+    members[(chat_id, assistant_id)] = True
+    activity.touch(assistant_id, chat_id)
+
+
+def forget_warm(chat_id: int, assistant_id: int = None) -> None:
+    if assistant_id is None:
+        members.discard_where(lambda key: key[0] == chat_id)
+    else:
+        members.pop((chat_id, assistant_id))
+
+
+async def is_warm(chat_id: int) -> bool:
+    userbot = await get_assistant(chat_id)
+    return (chat_id, userbot.id) in members
+
+
+async def warm_up(chat_id: int) -> bool:
+    userbot = await get_assistant(chat_id)
+    try:
+        member = await app.get_chat_member(chat_id, userbot.id)
+        if member.status in (ChatMemberStatus.BANNED, ChatMemberStatus.RESTRICTED):
+            return False
+    except UserNotParticipant:
+        invitelink = links.get(chat_id)
+        if not invitelink:
+            chat = await app.get_chat(chat_id)
+            invitelink = chat.username or await app.export_chat_invite_link(chat_id)
+        invitelink = _invite(invitelink)
+        try:
+            await userbot.join_chat(invitelink)
+        except UserAlreadyParticipant:
+            pass
+        except InviteRequestSent:
+            await app.approve_chat_join_request(chat_id, userbot.id)
+        links[chat_id] = invitelink
+    try:
+        await userbot.resolve_peer(chat_id)
+    except Exception:
+        pass
+    mark_warm(chat_id, userbot.id)
+    return True
+
+
+async def _warm_task(chat_id: int) -> None:
+    try:
+        if not await is_warm(chat_id):
+            await warm_up(chat_id)
+    except Exception as e:
+        LOGGER(__name__).info(f"Assistant warm-up skipped for {chat_id}: {e}")
+    finally:
+        warming.pop(chat_id, None)
+
+
+def schedule_warmup(chat_id: int) -> None:
+    if chat_id in warming:
+        return
+    warming[chat_id] = asyncio.create_task(_warm_task(chat_id))
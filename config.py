@@ -28,6 +28,7 @@ SONG_DOWNLOAD_DURATION = int(getenv("SONG_DOWNLOAD_DURATION", "9999999"))
 SONG_DOWNLOAD_DURATION_LIMIT = int(getenv("SONG_DOWNLOAD_DURATION_LIMIT", "9999999"))
 TG_AUDIO_FILESIZE_LIMIT = int(getenv("TG_AUDIO_FILESIZE_LIMIT", "5242880000"))
 TG_VIDEO_FILESIZE_LIMIT = int(getenv("TG_VIDEO_FILESIZE_LIMIT", "5242880000"))
+TG_STREAM_PREBUFFER = int(getenv("TG_STREAM_PREBUFFER", "4194304")) #bytes fetched before telegram media starts playing, 0 disables streaming
 
 # ───── Custom API Configs ───── #
 API_URL = getenv("API_URL") #optional
@@ -51,6 +52,7 @@ SUPPORT_CHAT = getenv("SUPPORT_CHAT", "https://t.me/+AzKGhJreNmhiZTll")
 # ───── Assistant Auto Leave ───── #
 AUTO_LEAVING_ASSISTANT = False
 AUTO_LEAVE_ASSISTANT_TIME = int(getenv("ASSISTANT_LEAVE_TIME", "11500"))
+AUTO_LEAVE_RATE = int(getenv("ASSISTANT_LEAVE_RATE", "20")) #chats left per assistant every 15 mins
 
 # ───── Error Handling ───── #
 DEBUG_IGNORE_LOG =True
@@ -69,6 +71,10 @@ STRING5 = getenv("STRING_SESSION5")
 # ───── Server Settings ───── #
 SERVER_PLAYLIST_LIMIT = int(getenv("SERVER_PLAYLIST_LIMIT", "3000"))
 PLAYLIST_FETCH_LIMIT = int(getenv("PLAYLIST_FETCH_LIMIT", "2500"))
+VIDEO_STREAM_LIMIT = int(getenv("VIDEO_STREAM_LIMIT", "0")) #0 means unlimited
+ASSISTANT_VIDEO_LIMIT = int(getenv("ASSISTANT_VIDEO_LIMIT", "0")) #0 means unlimited
+METRICS_PORT = int(getenv("METRICS_PORT", "0")) #optional, serves /metrics when set
+MEDIA_CACHE_LIMIT = int(getenv("MEDIA_CACHE_LIMIT", "2147483648")) #bytes of unused downloads kept for replays, 0 deletes them right away
 
 # ───── Bot Media Assets ───── #
 
@@ -108,7 +114,7 @@ AYUV = [
 
 # ───── Runtime Structures ───── #
 BANNED_USERS = filters.user()
-adminlist, lyrical, votemode, autoclean, confirmer = {}, {}, {}, [], {}
+adminlist, lyrical, votemode, confirmer = {}, {}, {}, {}
 
 # ───── URL Validation ───── #
 if SUPPORT_CHANNEL and not re.match(r"^https?://", SUPPORT_CHANNEL):